@@ -1,28 +1,23 @@
-import logging
+import os
 import sys
 
-from dotenv import find_dotenv, load_dotenv
-from setproctitle import setproctitle
-
 from git_cuttle.cli import CliOpts, EnvAction
 from git_cuttle.errors import AppError, format_user_error
-from git_cuttle.orchestrator import run
+from git_cuttle.lib import Options
 from git_cuttle.transaction import TransactionRollbackError
 
 __all__ = ["main", "EnvAction"]
 
 
 def main() -> None:
-    setproctitle("gitcuttle")
-    load_dotenv(find_dotenv(usecwd=True))
+    _set_process_title(sys.argv[1:])
+    _load_dotenv()
 
     try:
         cli_opts = CliOpts.parse_args()
 
-        logging.basicConfig(
-            level=logging.DEBUG if cli_opts.verbose else logging.INFO,
-            format="%(message)s",
-        )
+        if cli_opts.verbose:
+            _configure_verbose_logging()
 
         run(cli_opts.app_opts, command_name=cli_opts.command_name)
     except AppError as error:
@@ -46,3 +41,39 @@ def main() -> None:
             file=sys.stderr,
         )
         raise SystemExit(2)
+
+
+def run(opts: Options, *, command_name: str) -> None:
+    # The orchestrator pulls in every workflow dependency; `--help` and argument
+    # errors exit before reaching it.
+    from git_cuttle.orchestrator import run as run_command
+
+    run_command(opts, command_name=command_name)
+
+
+def _configure_verbose_logging() -> None:
+    # Nothing logs below WARNING unless verbose, and logging's last-resort
+    # handler already prints warnings, so quiet runs skip the setup and import.
+    import logging
+
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
+
+def _set_process_title(argv: list[str]) -> None:
+    # Help output exits immediately, so skip loading the C extension for it.
+    if "-h" in argv or "--help" in argv:
+        return
+
+    from setproctitle import setproctitle
+
+    setproctitle("gitcuttle")
+
+
+def _load_dotenv() -> None:
+    if os.environ.get("GITCUTTLE_SKIP_DOTENV") == "1":
+        return
+
+    # Imported here so skipping dotenv also skips its import cost.
+    from dotenv import find_dotenv, load_dotenv
+
+    load_dotenv(find_dotenv(usecwd=True))
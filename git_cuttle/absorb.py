@@ -82,8 +82,7 @@ def absorb_octopus_workspace(
         parent_refs=workspace.octopus_parents,
     )
     merge_commit, post_merge_commits = _split_octopus_history(
-        repo_root=repo_root,
-        unique_commits=unique_commits,
+        unique_commits=unique_commits
     )
 
     if not post_merge_commits:
@@ -146,15 +145,22 @@ def absorb_octopus_workspace(
             )
         )
     else:
+        commits_by_parent: dict[str, list[str]] = {}
         for item in planned:
-            transaction.add_step(
-                _cherry_pick_to_parent_step(
-                    repo_root=repo_root,
-                    transaction=transaction,
-                    commit=item.commit,
-                    target_parent=item.target_parent,
+            commits_by_parent.setdefault(item.target_parent, []).append(item.commit)
+        # One checkout per parent, but each pick is its own step so a conflict
+        # partway through a group still rolls back the picks before it.
+        for parent, commits in commits_by_parent.items():
+            for index, commit in enumerate(commits):
+                transaction.add_step(
+                    _cherry_pick_to_parent_step(
+                        repo_root=repo_root,
+                        transaction=transaction,
+                        commit=commit,
+                        target_parent=parent,
+                        checkout=index == 0,
+                    )
                 )
-            )
 
     transaction.add_step(
         _rebuild_octopus_step(
@@ -171,9 +177,11 @@ def absorb_octopus_workspace(
         )
     )
 
+    transaction_completed = False
     try:
         try:
             transaction.run()
+            transaction_completed = True
         except TransactionExecutionError as error:
             if isinstance(error.cause, AppError):
                 raise error.cause
@@ -183,7 +191,12 @@ def absorb_octopus_workspace(
                 details=str(error.cause),
             ) from error
     finally:
-        current_branch = _current_branch(repo_root=repo_root)
+        # A completed transaction always ends on the rebuilt workspace branch.
+        current_branch = (
+            workspace.branch
+            if transaction_completed
+            else _current_branch(repo_root=repo_root)
+        )
         if (
             original_branch is not None
             and current_branch is not None
@@ -301,6 +314,7 @@ def _cherry_pick_to_parent_step(
     transaction: Transaction,
     commit: str,
     target_parent: str,
+    checkout: bool,
 ) -> TransactionStep:
     return TransactionStep(
         name=f"cherry-pick:{commit[:12]}->{target_parent}",
@@ -308,6 +322,7 @@ def _cherry_pick_to_parent_step(
             repo_root=repo_root,
             commit=commit,
             target_parent=target_parent,
+            checkout=checkout,
         ),
         rollback=lambda: _restore_branch_from_backup_ref(
             repo_root=repo_root,
@@ -387,8 +402,10 @@ def _cherry_pick_commit_to_parent(
     repo_root: Path,
     commit: str,
     target_parent: str,
+    checkout: bool,
 ) -> None:
-    _checkout_branch(repo_root=repo_root, branch=target_parent)
+    if checkout:
+        _checkout_branch(repo_root=repo_root, branch=target_parent)
     _git(
         repo_root=repo_root,
         args=["cherry-pick", commit],
@@ -481,6 +498,16 @@ def _plan_absorb_targets(
     interactive: bool,
     chooser: CommitTargetChooser | None,
 ) -> list[AbsorbedCommit]:
+    changed_files_by_commit: dict[str, frozenset[str]] = {}
+    paths_by_parent: dict[str, frozenset[str]] = {}
+    if explicit_target is None and not interactive:
+        changed_files_by_commit = _changed_files_by_commit(
+            repo_root=repo_root, commits=commits
+        )
+        paths_by_parent = {
+            parent: _paths_at_ref(repo_root=repo_root, ref=parent) for parent in parents
+        }
+
     planned: list[AbsorbedCommit] = []
     for commit in commits:
         if explicit_target is not None:
@@ -490,7 +517,10 @@ def _plan_absorb_targets(
             target = chooser(commit, parents)
         else:
             target = _heuristic_target_parent(
-                repo_root=repo_root, commit=commit, parents=parents
+                commit=commit,
+                changed_files=changed_files_by_commit.get(commit, frozenset()),
+                parents=parents,
+                paths_by_parent=paths_by_parent,
             )
 
         if target not in parents:
@@ -506,9 +536,12 @@ def _plan_absorb_targets(
 
 
 def _heuristic_target_parent(
-    *, repo_root: Path, commit: str, parents: tuple[str, ...]
+    *,
+    commit: str,
+    changed_files: frozenset[str],
+    parents: tuple[str, ...],
+    paths_by_parent: dict[str, frozenset[str]],
 ) -> str:
-    changed_files = _commit_changed_files(repo_root=repo_root, commit=commit)
     if not changed_files:
         raise AppError(
             code="absorb-target-uncertain",
@@ -517,15 +550,11 @@ def _heuristic_target_parent(
             guidance=("rerun with an explicit parent branch or interactive mode (-i)",),
         )
 
-    scores: dict[str, int] = {}
-    for parent in parents:
-        matches = 0
-        for changed_file in changed_files:
-            if _path_exists_at_ref(repo_root=repo_root, ref=parent, path=changed_file):
-                matches += 1
-        scores[parent] = matches
-
-    best_parent, best_score = max(scores.items(), key=lambda item: item[1])
+    scores = {
+        parent: len(changed_files & paths_by_parent[parent]) for parent in parents
+    }
+    best_parent = max(scores, key=scores.__getitem__)
+    best_score = scores[best_parent]
     tied = sum(1 for score in scores.values() if score == best_score) > 1
     confidence = best_score / len(changed_files)
     if best_score == 0 or tied or confidence < 0.6:
@@ -543,72 +572,85 @@ def _heuristic_target_parent(
 
 
 def _split_octopus_history(
-    *, repo_root: Path, unique_commits: list[str]
+    *, unique_commits: list[tuple[str, tuple[str, ...]]]
 ) -> tuple[str | None, list[str]]:
     if not unique_commits:
         return None, []
-    first_commit = unique_commits[0]
-    if _is_merge_commit(repo_root=repo_root, commit=first_commit):
-        return first_commit, unique_commits[1:]
-    return None, unique_commits
+    commits = [commit for commit, _ in unique_commits]
+    first_commit, first_parents = unique_commits[0]
+    if len(first_parents) > 1:
+        return first_commit, commits[1:]
+    return None, commits
 
 
-def _commit_changed_files(*, repo_root: Path, commit: str) -> list[str]:
-    result = subprocess.run(
-        ["git", "show", "--pretty=", "--name-only", commit],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=repo_root,
+def _changed_files_by_commit(
+    *, repo_root: Path, commits: list[str]
+) -> dict[str, frozenset[str]]:
+    if not commits:
+        return {}
+
+    result = _git_raw(
+        repo_root=repo_root,
+        args=[
+            "log",
+            "--no-walk",
+            "--cc",
+            "--name-only",
+            "--format=%x00%H",
+            *commits,
+        ],
     )
     if result.returncode != 0:
-        details = result.stderr.strip() or result.stdout.strip() or commit
+        details = _failure_details(result) or commits[0]
         raise AppError(
             code="absorb-analysis-failed",
             message="failed to inspect changed files for absorb",
             details=details,
         )
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
 
+    changed_files: dict[str, set[str]] = {}
+    current: set[str] = set()
+    for line in _decode(result.stdout).splitlines():
+        if line.startswith("\0"):
+            current = changed_files.setdefault(line[1:], set())
+        elif line.strip():
+            current.add(line.strip())
+    return {commit: frozenset(files) for commit, files in changed_files.items()}
 
-def _path_exists_at_ref(*, repo_root: Path, ref: str, path: str) -> bool:
-    result = subprocess.run(
-        ["git", "cat-file", "-e", f"{ref}:{path}"],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=repo_root,
-    )
-    return result.returncode == 0
+
+def _paths_at_ref(*, repo_root: Path, ref: str) -> frozenset[str]:
+    result = _git_raw(repo_root=repo_root, args=["ls-tree", "-r", "--name-only", ref])
+    if result.returncode != 0:
+        details = _failure_details(result) or ref
+        raise AppError(
+            code="absorb-analysis-failed",
+            message="failed to inspect parent tree for absorb",
+            details=details,
+        )
+    return frozenset(line for line in _decode(result.stdout).splitlines() if line)
 
 
 def _octopus_unique_commits(
     *, repo_root: Path, branch: str, parent_refs: tuple[str, ...]
-) -> list[str]:
-    result = subprocess.run(
-        ["git", "rev-list", "--reverse", branch, "--not", *parent_refs],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=repo_root,
+) -> list[tuple[str, tuple[str, ...]]]:
+    result = _git_raw(
+        repo_root=repo_root,
+        args=["rev-list", "--reverse", "--parents", branch, "--not", *parent_refs],
     )
     if result.returncode != 0:
-        details = result.stderr.strip() or result.stdout.strip() or branch
+        details = _failure_details(result) or branch
         raise AppError(
             code="octopus-update-analysis-failed",
             message="failed to analyze octopus branch history",
             details=details,
         )
 
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
-
-
-def _is_merge_commit(*, repo_root: Path, commit: str) -> bool:
-    parent_line = _git_stdout(
-        repo_root=repo_root, args=["show", "-s", "--format=%P", commit]
-    )
-    parent_oids = [parent for parent in parent_line.split() if parent]
-    return len(parent_oids) > 1
+    unique_commits: list[tuple[str, tuple[str, ...]]] = []
+    for line in _decode(result.stdout).splitlines():
+        oids = line.split()
+        if oids:
+            unique_commits.append((oids[0], tuple(oids[1:])))
+    return unique_commits
 
 
 def _branch_head(*, repo_root: Path, branch: str) -> str:
@@ -626,14 +668,14 @@ def _branch_head(*, repo_root: Path, branch: str) -> str:
 def _rev_parse(*, repo_root: Path, ref: str) -> str | None:
     result = subprocess.run(
         ["git", "rev-parse", "--verify", ref],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=False,
         cwd=repo_root,
     )
     if result.returncode != 0:
         return None
-    return result.stdout.strip()
+    return result.stdout.strip().decode("ascii")
 
 
 def _current_branch(*, repo_root: Path) -> str | None:
@@ -658,15 +700,9 @@ def _checkout_branch(*, repo_root: Path, branch: str) -> None:
 
 
 def _git(*, repo_root: Path, args: list[str], code: str, message: str) -> None:
-    result = subprocess.run(
-        ["git", *args],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=repo_root,
-    )
+    result = _git_raw(repo_root=repo_root, args=args)
     if result.returncode != 0:
-        details = result.stderr.strip() or result.stdout.strip() or " ".join(args)
+        details = _failure_details(result) or " ".join(args)
         raise AppError(
             code=code,
             message=message,
@@ -706,14 +742,27 @@ def _git_stdout(
     code: str = "git-command-failed",
     message: str = "git command failed",
 ) -> str:
-    result = subprocess.run(
+    result = _git_raw(repo_root=repo_root, args=args)
+    if result.returncode != 0:
+        details = _failure_details(result) or " ".join(args)
+        raise AppError(code=code, message=message, details=details)
+    return _decode(result.stdout)
+
+
+def _git_raw(*, repo_root: Path, args: list[str]) -> subprocess.CompletedProcess[bytes]:
+    # Output stays as bytes so OID reads skip text decoding; callers decode once.
+    return subprocess.run(
         ["git", *args],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         check=False,
         cwd=repo_root,
     )
-    if result.returncode != 0:
-        details = result.stderr.strip() or result.stdout.strip() or " ".join(args)
-        raise AppError(code=code, message=message, details=details)
-    return result.stdout.strip()
+
+
+def _failure_details(result: subprocess.CompletedProcess[bytes]) -> str:
+    return _decode(result.stderr) or _decode(result.stdout)
+
+
+def _decode(output: bytes) -> str:
+    return output.decode("utf-8", "replace").strip()
@@ -1,5 +1,8 @@
 import argparse
+import functools
 import os
+import sys
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Any, NoReturn
 
@@ -27,121 +30,194 @@ def add_destination_flag(parser: argparse.ArgumentParser) -> None:
     )
 
 
-@dataclass(kw_only=True, frozen=True)
+def build_parser(
+    *, command: str | None = None, help_only: bool = False
+) -> argparse.ArgumentParser:
+    """Return the CLI parser, reusing it while the env fallbacks are unchanged.
+
+    When ``command`` names a known subcommand only that subparser is built.
+    ``help_only`` skips subcommand arguments, which top-level help never shows.
+    """
+    if command not in _SUBCOMMAND_HELP:
+        command = None
+    return _build_parser(
+        verbose_env=os.environ.get("GITCUTTLE_VERBOSE"),
+        command=command,
+        help_only=help_only,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_parser(
+    *, verbose_env: str | None, command: str | None, help_only: bool
+) -> argparse.ArgumentParser:
+    # EnvAction reads its default at construction, so the env value keys the cache.
+    _ = verbose_env
+    parser = ErrorHandlingArgumentParser()
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action=EnvAction,
+        env_var="GITCUTTLE_VERBOSE",
+        nargs=0,
+        help="show more detailed log messages",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in _SUBCOMMAND_HELP.items():
+        if command is None or name == command:
+            command_parser = subparsers.add_parser(name, help=help_text)
+            if not help_only:
+                _SUBCOMMAND_ARGUMENTS[name](command_parser)
+
+    return parser
+
+
+def _is_top_level_help(argv: Sequence[str]) -> bool:
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return True
+        if not arg.startswith("-"):
+            return False
+    return False
+
+
+def _requested_command(argv: Sequence[str]) -> str | None:
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _add_new_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-b",
+        "--branch",
+        help="new branch name to create",
+    )
+    parser.add_argument(
+        "bases",
+        nargs="*",
+        help="base ref(s): one for standard, two or more for octopus",
+    )
+    add_destination_flag(parser)
+
+
+def _add_list_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--json",
+        dest="json_output",
+        action="store_true",
+        help="render output as json",
+    )
+
+
+def _add_delete_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("branch", help="workspace branch to delete")
+    _add_mutation_flags(parser)
+
+
+def _add_prune_arguments(parser: argparse.ArgumentParser) -> None:
+    _add_mutation_flags(parser)
+
+
+def _add_update_arguments(parser: argparse.ArgumentParser) -> None:
+    _ = parser
+
+
+def _add_absorb_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "target_parent", nargs="?", default=None, help="target parent branch"
+    )
+    parser.add_argument(
+        "-i",
+        "--interactive",
+        action="store_true",
+        help="choose a target parent for each commit",
+    )
+
+
+def _add_mutation_flags(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--dry-run", action="store_true", help="print plan without mutating"
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_output",
+        action="store_true",
+        help="render output as json",
+    )
+    parser.add_argument("--force", action="store_true", help="bypass safety checks")
+
+
+_SUBCOMMAND_HELP = {
+    "new": "create a new workspace",
+    "list": "list tracked workspaces",
+    "delete": "delete a tracked workspace",
+    "prune": "prune stale tracked workspaces",
+    "update": "update current workspace",
+    "absorb": "absorb octopus commits into parent branches",
+}
+_SUBCOMMAND_ARGUMENTS: dict[str, Callable[[argparse.ArgumentParser], None]] = {
+    "new": _add_new_arguments,
+    "list": _add_list_arguments,
+    "delete": _add_delete_arguments,
+    "prune": _add_prune_arguments,
+    "update": _add_update_arguments,
+    "absorb": _add_absorb_arguments,
+}
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
 class CliOpts:
     app_opts: Options
     command_name: str
     verbose: bool
 
     @staticmethod
-    def parse_args() -> "CliOpts":
-        parser = ErrorHandlingArgumentParser()
-        parser.add_argument(
-            "-v",
-            "--verbose",
-            action=EnvAction,
-            env_var="GITCUTTLE_VERBOSE",
-            nargs=0,
-            help="show more detailed log messages",
+    def parse_args(argv: Sequence[str] | None = None) -> "CliOpts":
+        if argv is None:
+            argv = sys.argv[1:]
+        return _parse_cli_opts(
+            tuple(argv), verbose_env=os.environ.get("GITCUTTLE_VERBOSE")
         )
 
-        subparsers = parser.add_subparsers(dest="command", required=True)
-
-        new_parser = subparsers.add_parser("new", help="create a new workspace")
-        new_parser.add_argument(
-            "-b",
-            "--branch",
-            help="new branch name to create",
-        )
-        new_parser.add_argument(
-            "bases",
-            nargs="*",
-            help="base ref(s): one for standard, two or more for octopus",
-        )
-        add_destination_flag(new_parser)
-
-        list_parser = subparsers.add_parser("list", help="list tracked workspaces")
-        list_parser.add_argument(
-            "--json",
-            dest="json_output",
-            action="store_true",
-            help="render output as json",
-        )
 
-        delete_parser = subparsers.add_parser(
-            "delete", help="delete a tracked workspace"
-        )
-        delete_parser.add_argument("branch", help="workspace branch to delete")
-        delete_parser.add_argument(
-            "--dry-run", action="store_true", help="print plan without mutating"
-        )
-        delete_parser.add_argument(
-            "--json",
-            dest="json_output",
-            action="store_true",
-            help="render output as json",
-        )
-        delete_parser.add_argument(
-            "--force", action="store_true", help="bypass safety checks"
-        )
-
-        prune_parser = subparsers.add_parser(
-            "prune", help="prune stale tracked workspaces"
-        )
-        prune_parser.add_argument(
-            "--dry-run", action="store_true", help="print plan without mutating"
-        )
-        prune_parser.add_argument(
-            "--json",
-            dest="json_output",
-            action="store_true",
-            help="render output as json",
-        )
-        prune_parser.add_argument(
-            "--force", action="store_true", help="bypass safety checks"
-        )
-
-        subparsers.add_parser("update", help="update current workspace")
+@functools.lru_cache(maxsize=32)
+def _parse_cli_opts(argv: tuple[str, ...], *, verbose_env: str | None) -> CliOpts:
+    # CliOpts is immutable, so identical argv and env can share one result.
+    _ = verbose_env
+    parser = build_parser(
+        command=_requested_command(argv), help_only=_is_top_level_help(argv)
+    )
+    args = parser.parse_args(argv)
 
-        absorb_parser = subparsers.add_parser(
-            "absorb", help="absorb octopus commits into parent branches"
-        )
-        absorb_parser.add_argument(
-            "target_parent", nargs="?", default=None, help="target parent branch"
-        )
-        absorb_parser.add_argument(
-            "-i",
-            "--interactive",
-            action="store_true",
-            help="choose a target parent for each commit",
-        )
+    base_ref: str | None = None
+    parent_refs: tuple[str, ...] = ()
+    if args.command == "new":
+        bases: list[str] = args.bases
+        if len(bases) == 1:
+            base_ref = bases[0]
+        elif len(bases) >= 2:
+            parent_refs = tuple(bases)
 
-        args = parser.parse_args()
-
-        base_ref: str | None = None
-        parent_refs: tuple[str, ...] = ()
-        if args.command == "new":
-            bases: list[str] = args.bases
-            if len(bases) == 1:
-                base_ref = bases[0]
-            elif len(bases) >= 2:
-                parent_refs = tuple(bases)
-
-        return CliOpts(
-            app_opts=Options(
-                branch=getattr(args, "branch", None),
-                base_ref=base_ref,
-                parent_refs=parent_refs,
-                destination=getattr(args, "destination", False),
-                dry_run=getattr(args, "dry_run", False),
-                json_output=getattr(args, "json_output", False),
-                force=getattr(args, "force", False),
-                interactive=getattr(args, "interactive", False),
-                target_parent=getattr(args, "target_parent", None),
-            ),
-            command_name=args.command,
-            verbose=args.verbose is not None,
-        )
+    return CliOpts(
+        app_opts=Options(
+            branch=getattr(args, "branch", None),
+            base_ref=base_ref,
+            parent_refs=parent_refs,
+            destination=getattr(args, "destination", False),
+            dry_run=getattr(args, "dry_run", False),
+            json_output=getattr(args, "json_output", False),
+            force=getattr(args, "force", False),
+            interactive=getattr(args, "interactive", False),
+            target_parent=getattr(args, "target_parent", None),
+        ),
+        command_name=args.command,
+        verbose=args.verbose is not None,
+    )
 
 
 class EnvAction(argparse.Action):
@@ -163,15 +239,14 @@ class EnvAction(argparse.Action):
         elif env_var:
             help += f" (env: {env_var})"
 
-        if env_var and env_var in os.environ:
-            default = os.environ[env_var]
-            if default == "":
-                default = None
+        env_value = os.environ.get(env_var) if env_var else None
+        if env_value is not None:
+            default = env_value or None
 
         if default is not None or nargs == 0:
             required = False
 
-        super(EnvAction, self).__init__(
+        super().__init__(
             help=help,
             default=default,
             required=required,
@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Literal
 
 from git_cuttle.errors import AppError
-from git_cuttle.git_ops import add_worktree, canonical_git_dir, repo_root
+from git_cuttle.git_ops import add_worktree, canonical_git_dir, head_branch, repo_root
 from git_cuttle.metadata_manager import MetadataManager, WorkspacesMetadata
 from git_cuttle.plan_output import (
     DryRunPlan,
@@ -30,20 +30,7 @@ DeleteBlockReason = Literal[
 
 
 def current_branch(*, cwd: Path) -> str | None:
-    result = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=cwd,
-    )
-    if result.returncode != 0:
-        return None
-
-    branch = result.stdout.strip()
-    if branch == "" or branch == "HEAD":
-        return None
-    return branch
+    return head_branch(cwd)
 
 
 def delete_block_reason(
@@ -105,11 +92,7 @@ def delete_workspace(
             guidance=("switch to a different branch and rerun",),
         )
 
-    if (
-        not force
-        and workspace.worktree_path.exists()
-        and _worktree_has_uncommitted_changes(cwd=workspace.worktree_path)
-    ):
+    if not force and _worktree_has_uncommitted_changes(cwd=workspace.worktree_path):
         raise AppError(
             code="workspace-dirty",
             message="workspace has uncommitted changes",
@@ -123,9 +106,7 @@ def delete_workspace(
             default_remote=repo.default_remote,
             branch=workspace.branch,
         )
-        if upstream_ref is None or not _ref_exists(
-            repo_root=repo_root_dir, ref=f"refs/remotes/{upstream_ref}"
-        ):
+        if upstream_ref is None:
             raise AppError(
                 code="no-upstream",
                 message="workspace has no upstream branch configured",
@@ -165,11 +146,11 @@ def delete_workspace(
     if dry_run:
         return render_json_plan(plan) if json_output else render_human_plan(plan)
 
-    updated_workspaces = dict(repo.workspaces)
-    updated_workspaces.pop(branch)
+    updated_workspaces = {
+        name: tracked for name, tracked in repo.workspaces.items() if name != branch
+    }
     updated_repo = replace(repo, workspaces=updated_workspaces)
-    updated_repos = dict(metadata.repos)
-    updated_repos[repo_key] = updated_repo
+    updated_repos = {**metadata.repos, repo_key: updated_repo}
     updated_metadata = WorkspacesMetadata(version=metadata.version, repos=updated_repos)
 
     transaction = Transaction()
@@ -273,27 +254,18 @@ def _workspace_upstream_ref(
     return f"{remote_name}/{branch}"
 
 
-def _ref_exists(*, repo_root: Path, ref: str) -> bool:
-    result = subprocess.run(
-        ["git", "rev-parse", "--verify", ref],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=repo_root,
-    )
-    return result.returncode == 0
-
-
 def _ahead_count(
     *, repo_root: Path, local_branch: str, upstream_ref: str
 ) -> int | None:
+    # Fully qualified refs make rev-list fail when either side is missing,
+    # which covers the upstream existence check.
     result = subprocess.run(
         [
             "git",
             "rev-list",
             "--left-right",
             "--count",
-            f"{local_branch}...{upstream_ref}",
+            f"refs/heads/{local_branch}...refs/remotes/{upstream_ref}",
         ],
         capture_output=True,
         text=True,
@@ -314,16 +286,35 @@ def _ahead_count(
 
 
 def _worktree_has_uncommitted_changes(*, cwd: Path) -> bool:
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=cwd,
-    )
+    # Spawning into a missing worktree fails fast, so no separate exists() check.
+    try:
+        result = subprocess.run(
+            ["git", "--no-optional-locks", "status", "--porcelain", "--no-renames"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
+            cwd=cwd,
+        )
+    except FileNotFoundError as error:
+        # Only a worktree that is really gone has nothing to lose; a missing
+        # git binary must not pass the safety check as clean.
+        if cwd.exists():
+            raise _workspace_status_error(cwd=cwd, error=error) from error
+        return False
+    except OSError as error:
+        raise _workspace_status_error(cwd=cwd, error=error) from error
     return result.returncode == 0 and bool(result.stdout.strip())
 
 
+def _workspace_status_error(*, cwd: Path, error: OSError) -> AppError:
+    return AppError(
+        code="workspace-status-failed",
+        message="failed to check workspace for uncommitted changes",
+        details=f"{cwd}: {error}",
+        guidance=("fix access to the workspace or rerun with --force",),
+    )
+
+
 def _remove_worktree(*, repo_root: Path, worktree_path: Path, force: bool) -> None:
     args = ["git", "worktree", "remove"]
     if force:
@@ -365,14 +356,14 @@ def _delete_local_branch(*, repo_root: Path, branch: str, force: bool) -> None:
 def _branch_head_oid(*, repo_root: Path, branch: str) -> str | None:
     result = subprocess.run(
         ["git", "rev-parse", "--verify", f"refs/heads/{branch}"],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=False,
         cwd=repo_root,
     )
     if result.returncode != 0:
         return None
-    return result.stdout.strip()
+    return result.stdout.strip().decode("ascii")
 
 
 def _restore_worktree(*, repo_root: Path, branch: str, worktree_path: Path) -> None:
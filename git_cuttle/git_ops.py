@@ -1,8 +1,12 @@
+import functools
+import os
 import subprocess
 from pathlib import Path
 
 BACKUP_REF_PREFIX = "refs/gitcuttle/txn"
 
+_REPO_PATH_OPTIONS = ("--show-toplevel", "--git-dir", "--git-common-dir")
+
 
 IN_PROGRESS_STATE_MARKERS = (
     "MERGE_HEAD",
@@ -15,47 +19,37 @@ IN_PROGRESS_STATE_MARKERS = (
 
 
 def in_git_repo(cwd: Path | None = None) -> bool:
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=cwd,
-    )
-    return result.returncode == 0
+    # A `.git` dir with a HEAD (or a worktree `gitdir:` file) at cwd settles it
+    # without forking git; anything else, even a broken `.git`, asks git.
+    if _has_plausible_dot_git(cwd or Path.cwd()):
+        return True
+    return repo_root(cwd) is not None
+
+
+def _has_plausible_dot_git(path: Path) -> bool:
+    dot_git = path / ".git"
+    if dot_git.is_dir():
+        return (dot_git / "HEAD").is_file()
+    try:
+        content = dot_git.read_text()
+    except (OSError, UnicodeDecodeError):
+        return False
+    if not content.startswith("gitdir:"):
+        return False
+    # A dangling gitfile (e.g. a removed worktree) must not count as a repo.
+    target = Path(content[len("gitdir:") :].strip())
+    return (path / target / "HEAD").is_file()
 
 
 def repo_root(cwd: Path | None = None) -> Path | None:
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=cwd,
-    )
-    if result.returncode != 0:
+    top_level = _cached_rev_parse_path(cwd=cwd, option="--show-toplevel")
+    if top_level is None:
         return None
-
-    return Path(result.stdout.strip()).resolve(strict=False)
+    return top_level.resolve(strict=False)
 
 
 def git_dir(cwd: Path | None = None) -> Path | None:
-    result = subprocess.run(
-        ["git", "rev-parse", "--git-dir"],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=cwd,
-    )
-    if result.returncode != 0:
-        return None
-
-    candidate = Path(result.stdout.strip())
-    if candidate.is_absolute():
-        return candidate
-
-    base_dir = cwd or Path.cwd()
-    return (base_dir / candidate).resolve(strict=False)
+    return _cached_rev_parse_path(cwd=cwd, option="--git-dir")
 
 
 def canonical_git_dir(cwd: Path | None = None) -> Path | None:
@@ -66,8 +60,12 @@ def canonical_git_dir(cwd: Path | None = None) -> Path | None:
 
 
 def git_common_dir(cwd: Path | None = None) -> Path | None:
+    return _cached_rev_parse_path(cwd=cwd, option="--git-common-dir")
+
+
+def default_remote_name(cwd: Path | None = None) -> str | None:
     result = subprocess.run(
-        ["git", "rev-parse", "--git-common-dir"],
+        ["git", "remote"],
         capture_output=True,
         text=True,
         check=False,
@@ -76,17 +74,17 @@ def git_common_dir(cwd: Path | None = None) -> Path | None:
     if result.returncode != 0:
         return None
 
-    candidate = Path(result.stdout.strip())
-    if candidate.is_absolute():
-        return candidate
-
-    base_dir = cwd or Path.cwd()
-    return (base_dir / candidate).resolve(strict=False)
+    remotes = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    if not remotes:
+        return None
+    if "origin" in remotes:
+        return "origin"
+    return sorted(remotes)[0]
 
 
-def default_remote_name(cwd: Path | None = None) -> str | None:
+def local_branch_names(cwd: Path | None = None) -> frozenset[str] | None:
     result = subprocess.run(
-        ["git", "remote"],
+        ["git", "for-each-ref", "--format=%(refname:lstrip=2)", "refs/heads/"],
         capture_output=True,
         text=True,
         check=False,
@@ -95,12 +93,7 @@ def default_remote_name(cwd: Path | None = None) -> str | None:
     if result.returncode != 0:
         return None
 
-    remotes = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-    if not remotes:
-        return None
-    if "origin" in remotes:
-        return "origin"
-    return sorted(remotes)[0]
+    return frozenset(line for line in result.stdout.splitlines() if line)
 
 
 def in_progress_operation(cwd: Path | None = None) -> str | None:
@@ -108,13 +101,35 @@ def in_progress_operation(cwd: Path | None = None) -> str | None:
     if repo_git_dir is None:
         return None
 
+    # One directory read instead of a stat per marker on the clean-repo path.
+    try:
+        with os.scandir(repo_git_dir) as entries:
+            entry_names = {entry.name for entry in entries}
+    except OSError:
+        return None
+
     for marker in IN_PROGRESS_STATE_MARKERS:
-        if (repo_git_dir / marker).exists():
+        if marker in entry_names:
             return marker
 
     return None
 
 
+def head_branch(cwd: Path | None = None) -> str | None:
+    # --symbolic-full-name fails on an unborn HEAD and prints HEAD when detached.
+    result = subprocess.run(
+        ["git", "rev-parse", "--symbolic-full-name", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=cwd,
+    )
+    full_name = result.stdout.strip()
+    if result.returncode != 0 or not full_name.startswith("refs/heads/"):
+        return None
+    return full_name[len("refs/heads/") :]
+
+
 def backup_ref_for_branch(*, txn_id: str, branch: str) -> str:
     return f"{BACKUP_REF_PREFIX}/{txn_id}/heads/{branch}"
 
@@ -125,17 +140,19 @@ def create_backup_refs_for_branches(
     branches: list[str],
     cwd: Path | None = None,
 ) -> dict[str, str]:
+    head_oids = _head_oids(branches=branches, cwd=cwd)
     backup_refs: dict[str, str] = {}
+    commands: list[str] = []
     for branch in branches:
-        head_ref = f"refs/heads/{branch}"
-        head_oid = _rev_parse_ref(head_ref=head_ref, cwd=cwd)
+        head_oid = head_oids.get(branch)
         if head_oid is None:
             raise RuntimeError(f"branch does not exist: {branch}")
 
         backup_ref = backup_ref_for_branch(txn_id=txn_id, branch=branch)
-        _update_ref(ref=backup_ref, oid=head_oid, cwd=cwd)
+        commands.append(f"update {backup_ref} {head_oid}")
         backup_refs[branch] = backup_ref
 
+    _update_refs(commands=commands, cwd=cwd)
     return backup_refs
 
 
@@ -201,31 +218,106 @@ def remove_backup_refs(*, txn_id: str, cwd: Path | None = None) -> None:
         raise RuntimeError(refs_result.stderr.strip() or "failed to list backup refs")
 
     refs = [line.strip() for line in refs_result.stdout.splitlines() if line.strip()]
-    for ref in refs:
-        delete_result = subprocess.run(
-            ["git", "update-ref", "-d", ref],
-            capture_output=True,
-            text=True,
-            check=False,
-            cwd=cwd,
-        )
-        if delete_result.returncode != 0:
-            raise RuntimeError(
-                delete_result.stderr.strip() or f"failed to delete ref {ref}"
-            )
+    _update_refs(commands=[f"delete {ref}" for ref in refs], cwd=cwd)
+
+
+class _RevParseFailed(Exception):
+    pass
+
+
+def _cached_rev_parse_path(*, cwd: Path | None, option: str) -> Path | None:
+    # One rev-parse answers every repo path query; the single-option retry
+    # covers layouts where --show-toplevel fails, such as bare repos.
+    # Failures raise out of the cache so a directory that later becomes a repo
+    # is not remembered as "not a repo".
+    resolved_cwd = (cwd or Path.cwd()).resolve()
+    for options in (_REPO_PATH_OPTIONS, (option,)):
+        try:
+            paths = _rev_parse_paths(cwd=resolved_cwd, options=options)
+        except _RevParseFailed:
+            continue
+        return paths[options.index(option)]
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _rev_parse_paths(*, cwd: Path, options: tuple[str, ...]) -> tuple[Path, ...]:
+    result = subprocess.run(
+        ["git", "rev-parse", *options],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=cwd,
+    )
+    lines = result.stdout.splitlines()
+    if result.returncode != 0 or len(lines) != len(options):
+        raise _RevParseFailed
+
+    paths: list[Path] = []
+    for line in lines:
+        candidate = Path(line.strip())
+        if not candidate.is_absolute():
+            candidate = (cwd / candidate).resolve(strict=False)
+        paths.append(candidate)
+    return tuple(paths)
 
 
 def _rev_parse_ref(*, head_ref: str, cwd: Path | None = None) -> str | None:
     result = subprocess.run(
         ["git", "rev-parse", "--verify", head_ref],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=False,
+        cwd=cwd,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip().decode("ascii")
+
+
+def _head_oids(*, branches: list[str], cwd: Path | None = None) -> dict[str, str]:
+    if not branches:
+        return {}
+
+    result = subprocess.run(
+        [
+            "git",
+            "for-each-ref",
+            "--format=%(objectname) %(refname:lstrip=2)",
+            *(f"refs/heads/{branch}" for branch in branches),
+        ],
         capture_output=True,
         text=True,
         check=False,
         cwd=cwd,
     )
     if result.returncode != 0:
-        return None
-    return result.stdout.strip()
+        raise RuntimeError(result.stderr.strip() or "failed to list branch heads")
+
+    # Patterns also match refs nested below a branch name, so keep exact names.
+    wanted = set(branches)
+    head_oids: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        oid, _, branch = line.partition(" ")
+        if branch in wanted:
+            head_oids[branch] = oid
+    return head_oids
+
+
+def _update_refs(*, commands: list[str], cwd: Path | None = None) -> None:
+    if not commands:
+        return
+
+    result = subprocess.run(
+        ["git", "update-ref", "--stdin"],
+        input="".join(f"{command}\n" for command in commands),
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=cwd,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or "failed to update refs")
 
 
 def _update_ref(*, ref: str, oid: str, cwd: Path | None = None) -> None:
@@ -62,8 +62,8 @@ def rows_for_repo(
 
 
 def render_workspace_table(rows: list[ListWorkspaceRow]) -> str:
-    table_rows = [
-        [
+    table_rows: list[tuple[str, ...]] = [
+        (
             row.repo,
             row.branch,
             row.dirty,
@@ -72,18 +72,16 @@ def render_workspace_table(rows: list[ListWorkspaceRow]) -> str:
             row.pull_request,
             row.description,
             row.worktree_path,
-        ]
+        )
         for row in rows
     ]
+    # Transposing with zip measures each column in one pass; a single format
+    # string then pads every cell of a row at once.
+    widths = [max(map(len, column)) for column in zip(TABLE_HEADERS, *table_rows)]
+    row_format = "  ".join(f"{{:<{width}}}" for width in widths)
 
-    widths = [len(header) for header in TABLE_HEADERS]
-    for table_row in table_rows:
-        for index, value in enumerate(table_row):
-            widths[index] = max(widths[index], len(value))
-
-    lines = [_format_row(values=TABLE_HEADERS, widths=widths)]
-    for table_row in table_rows:
-        lines.append(_format_row(values=tuple(table_row), widths=widths))
+    lines = [row_format.format(*TABLE_HEADERS)]
+    lines.extend(row_format.format(*table_row) for table_row in table_rows)
 
     if not table_rows:
         lines.append("(no tracked workspaces)")
@@ -104,10 +102,6 @@ def _remote_count(remote: RemoteAheadBehindStatus | None, field: str) -> str:
     return str(value)
 
 
-def _format_row(*, values: tuple[str, ...], widths: list[int]) -> str:
-    return "  ".join(value.ljust(widths[index]) for index, value in enumerate(values))
-
-
 def _pr_marker(pr: PullRequestStatus | None) -> str:
     if pr is None:
         return UNKNOWN_MARKER
@@ -1,6 +1,8 @@
+import errno
+import functools
 import json
 import os
-import tempfile
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -11,6 +13,9 @@ from git_cuttle.git_ops import canonical_git_dir, default_remote_name, repo_root
 SCHEMA_VERSION = 1
 WorkspaceKind = Literal["standard", "octopus"]
 MigrationFn = Callable[[dict[str, object]], dict[str, object]]
+_UNSUPPORTED_DIRECTORY_FSYNC_ERRNOS = frozenset(
+    {errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP}
+)
 
 
 @dataclass(kw_only=True, frozen=True)
@@ -51,33 +56,48 @@ def default_metadata_path() -> Path:
 @dataclass(kw_only=True)
 class MetadataManager:
     path: Path = field(default_factory=default_metadata_path)
+    # Stat identity of the file last read or written, with its metadata; a
+    # matching stat skips reading, parsing and validating the file again.
+    # Every read() until the file changes returns the same object, so callers
+    # must derive new metadata with replace() rather than mutate its dicts.
+    _cached_stat: tuple[int, int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_metadata: WorkspacesMetadata | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def ensure_parent_dir(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
     def read(self) -> WorkspacesMetadata:
-        if not self.path.exists():
+        file_stat = _stat_key(self.path)
+        if file_stat is None:
             return WorkspacesMetadata(version=SCHEMA_VERSION, repos={})
+        if file_stat == self._cached_stat and self._cached_metadata is not None:
+            return self._cached_metadata
 
         raw_text = self.path.read_text()
-        loaded = json.loads(raw_text)
-        loaded, migrated = _migrate_workspaces_metadata(loaded)
+        root, migrated = _migrate_workspaces_metadata(json.loads(raw_text))
         if migrated:
             _write_migration_backup(self.path, raw_text)
-            _atomic_write_text(
-                self.path,
-                json.dumps(loaded, indent=2),
-            )
+            _atomic_write_text(self.path, json.dumps(root, indent=2))
+            file_stat = _stat_key(self.path)
 
-        metadata = _parse_workspaces_metadata(loaded)
+        metadata = _parse_workspaces_metadata(root)
         _validate_workspaces_metadata(metadata)
+        self._cached_stat = file_stat
+        self._cached_metadata = metadata
         return metadata
 
     def write(self, metadata: WorkspacesMetadata) -> None:
         _validate_workspaces_metadata(metadata)
         self.ensure_parent_dir()
-        serialized = json.dumps(_serialize_workspaces_metadata(metadata), indent=2)
-        _atomic_write_text(self.path, serialized)
+        root = _serialize_workspaces_metadata(metadata)
+        _atomic_write_text(self.path, json.dumps(root, indent=2))
+        self._cached_stat = _stat_key(self.path)
+        # Cache a copy built from what was written, not the caller's instance.
+        self._cached_metadata = _parse_workspaces_metadata(root)
 
     def ensure_repo_tracked(
         self, *, cwd: Path, now: Callable[[], str] | None = None
@@ -106,38 +126,64 @@ class MetadataManager:
             workspaces=existing_repo.workspaces if existing_repo is not None else {},
         )
 
-        repos = dict(metadata.repos)
-        repos[repo_key] = updated_repo
+        repos = {**metadata.repos, repo_key: updated_repo}
         self.write(WorkspacesMetadata(version=metadata.version, repos=repos))
 
 
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    # Writes go through os.replace, so every rewrite also changes the inode.
+    try:
+        file_stat = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+
 def _utc_now_iso() -> str:
     return datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 def _atomic_write_text(path: Path, content: str) -> None:
-    parent = path.parent
-    temp_path: Path | None = None
+    temp_path = _write_temp_file(path, content)
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=parent,
-            prefix=f".{path.name}.",
-            suffix=".tmp",
-            delete=False,
-        ) as temp_file:
-            temp_path = Path(temp_file.name)
-            temp_file.write(content)
-            temp_file.flush()
-            os.fsync(temp_file.fileno())
-
         os.replace(temp_path, path)
-        _fsync_directory(parent)
+        _fsync_directory(path.parent)
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_temp_file(path: Path, content: str) -> Path:
+    # O_EXCL refuses an existing name, including a planted symlink, and the
+    # pid and thread id keep concurrent writers on distinct names.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0)
+    prefix = f".{path.name}.{os.getpid()}.{threading.get_ident()}"
+    attempt = 0
+    while True:
+        temp_path = path.with_name(f"{prefix}.{attempt}.tmp")
+        try:
+            fd = os.open(temp_path, flags, 0o600)
+        except FileExistsError:
+            attempt += 1
+            continue
+        break
+
+    try:
+        _write_and_close(fd, content)
     except Exception:
-        if temp_path is not None:
-            temp_path.unlink(missing_ok=True)
+        temp_path.unlink(missing_ok=True)
         raise
+    return temp_path
+
+
+def _write_and_close(fd: int, content: str) -> None:
+    try:
+        remaining = memoryview(content.encode("utf-8"))
+        while remaining:
+            remaining = remaining[os.write(fd, remaining) :]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 def _fsync_directory(path: Path) -> None:
@@ -148,13 +194,17 @@ def _fsync_directory(path: Path) -> None:
     fd = os.open(path, flags)
     try:
         os.fsync(fd)
+    except OSError as error:
+        # Some network filesystems reject fsync on directories; the rename is
+        # already durable as far as they can promise.
+        if error.errno not in _UNSUPPORTED_DIRECTORY_FSYNC_ERRNOS:
+            raise
     finally:
         os.close(fd)
 
 
-def _parse_workspaces_metadata(raw: object) -> WorkspacesMetadata:
-    root = _expect_json_object(raw, context="metadata file")
-
+def _parse_workspaces_metadata(root: dict[str, object]) -> WorkspacesMetadata:
+    # The root object was already checked by _migrate_workspaces_metadata.
     version = root.get("version")
     repos_raw = root.get("repos")
 
@@ -300,12 +350,24 @@ _MIGRATIONS: dict[int, MigrationFn] = {
 
 
 def _write_migration_backup(path: Path, file_content: str) -> Path:
-    timestamp = int(datetime.now(tz=timezone.utc).timestamp())
-    backup_path = path.with_name(f"{path.name}.bak.{timestamp}")
-    while backup_path.exists():
-        timestamp += 1
-        backup_path = path.with_name(f"{path.name}.bak.{timestamp}")
-    _atomic_write_text(backup_path, file_content)
+    # The content is fsynced under a temp name first, so a crash never leaves
+    # a truncated file under a valid-looking backup name. link() then claims
+    # the final name atomically and fails if another process already has it.
+    temp_path = _write_temp_file(path, file_content)
+    try:
+        timestamp = int(datetime.now(tz=timezone.utc).timestamp())
+        while True:
+            backup_path = path.with_name(f"{path.name}.bak.{timestamp}")
+            try:
+                os.link(temp_path, backup_path)
+            except FileExistsError:
+                timestamp += 1
+                continue
+            break
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+    _fsync_directory(path.parent)
     return backup_path
 
 
@@ -346,7 +408,7 @@ def _validate_workspaces_metadata(metadata: WorkspacesMetadata) -> None:
     for repo_key, repo in metadata.repos.items():
         if not repo.git_dir.is_absolute():
             raise ValueError("repo.git_dir must be an absolute path")
-        canonical_git_dir = repo.git_dir.resolve(strict=False)
+        canonical_git_dir = _resolved_path(repo.git_dir)
         if repo_key != str(canonical_git_dir):
             raise ValueError("repo key must match canonical repo.git_dir realpath")
         if repo.git_dir != canonical_git_dir:
@@ -373,6 +435,13 @@ def _validate_workspaces_metadata(metadata: WorkspacesMetadata) -> None:
                 raise ValueError("octopus workspaces must have at least two parents")
 
 
+@functools.lru_cache(maxsize=64)
+def _resolved_path(path: Path) -> Path:
+    # Every read and write re-validates each repo key; resolving walks the
+    # path one lstat per component, so remember it for the process.
+    return path.resolve(strict=False)
+
+
 def _validate_timestamp(value: str, *, field_name: str) -> None:
     try:
         datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -383,8 +452,5 @@ def _validate_timestamp(value: str, *, field_name: str) -> None:
 def _expect_json_object(raw: object, *, context: str) -> dict[str, object]:
     if not isinstance(raw, dict):
         raise ValueError(f"{context} must be an object")
-    raw_obj = cast(dict[object, object], raw)
-    for key_obj in raw_obj.keys():
-        if not isinstance(key_obj, str):
-            raise ValueError(f"{context} keys must be strings")
-    return cast(dict[str, object], raw_obj)
+    # Every caller passes json.loads output, whose object keys are always str.
+    return cast(dict[str, object], raw)
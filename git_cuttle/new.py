@@ -8,6 +8,7 @@ from git_cuttle.errors import AppError
 from git_cuttle.git_ops import canonical_git_dir, repo_root
 from git_cuttle.metadata_manager import (
     MetadataManager,
+    RepoMetadata,
     WorkspaceMetadata,
     WorkspacesMetadata,
 )
@@ -19,8 +20,17 @@ _HEX_TO_INVERSE_ALPHA = str.maketrans("0123456789abcdef", "zyxwvutsrqponmlk")
 
 
 def resolve_base_ref(*, cwd: Path, base_ref: str | None) -> str:
+    (base_oid,) = _resolve_refs(cwd=cwd, refs=[_base_lookup_ref(base_ref)])
+    return _checked_base_ref(base_ref=base_ref, base_oid=base_oid)
+
+
+def _base_lookup_ref(base_ref: str | None) -> str:
+    return "HEAD" if base_ref is None else base_ref
+
+
+def _checked_base_ref(*, base_ref: str | None, base_oid: str | None) -> str:
     if base_ref is not None:
-        if _rev_parse(cwd=cwd, ref=base_ref) is None:
+        if base_oid is None:
             raise AppError(
                 code="invalid-base-ref",
                 message="base ref does not exist",
@@ -32,14 +42,13 @@ def resolve_base_ref(*, cwd: Path, base_ref: str | None) -> str:
             )
         return base_ref
 
-    current_commit = _rev_parse(cwd=cwd, ref="HEAD")
-    if current_commit is None:
+    if base_oid is None:
         raise AppError(
             code="base-resolve-failed",
             message="failed to resolve current commit for default base",
             guidance=("pass an explicit base ref as `gitcuttle new <base> -b <name>`",),
         )
-    return current_commit
+    return base_oid
 
 
 def resolve_workspace_branch_name(
@@ -75,16 +84,11 @@ def create_standard_workspace(
     branch: str,
     base_ref: str | None,
     metadata_manager: MetadataManager,
+    tracked_repo: RepoMetadata | None = None,
 ) -> Path:
-    metadata_manager.ensure_repo_tracked(cwd=cwd)
-
-    repo_git_dir = canonical_git_dir(cwd)
-    repo_root_dir = repo_root(cwd)
-    if repo_git_dir is None or repo_root_dir is None:
-        raise AppError(
-            code="not-in-git-repo",
-            message="gitcuttle must be run from within a git repository",
-        )
+    repo_git_dir, repo_root_dir = _tracked_repo_paths(
+        cwd=cwd, metadata_manager=metadata_manager, tracked_repo=tracked_repo
+    )
 
     metadata = metadata_manager.read()
     repo_key = str(repo_git_dir)
@@ -96,10 +100,15 @@ def create_standard_workspace(
             guidance=("rerun the command to retry auto-tracking",),
         )
 
-    if _branch_exists(
-        cwd=repo_root_dir,
-        branch=branch,
-        remote=repo.default_remote,
+    # The local branch check and the base lookup share one cat-file batch.
+    local_branch_oid, base_oid = _resolve_refs(
+        cwd=repo_root_dir, refs=[f"refs/heads/{branch}", _base_lookup_ref(base_ref)]
+    )
+    if local_branch_oid is not None or (
+        repo.default_remote is not None
+        and _remote_branch_exists(
+            cwd=repo_root_dir, branch=branch, remote=repo.default_remote
+        )
     ):
         raise AppError(
             code="branch-already-exists",
@@ -108,15 +117,14 @@ def create_standard_workspace(
             guidance=("choose a new branch name",),
         )
 
-    resolved_base_ref = resolve_base_ref(cwd=repo_root_dir, base_ref=base_ref)
+    resolved_base_ref = _checked_base_ref(base_ref=base_ref, base_oid=base_oid)
     destination = derive_workspace_path(
         git_dir=repo_git_dir,
         branch=branch,
         sibling_branches=repo.workspaces.keys(),
     )
     timestamp = _utc_now_iso()
-    updated_workspaces = dict(repo.workspaces)
-    updated_workspaces[branch] = WorkspaceMetadata(
+    workspace = WorkspaceMetadata(
         branch=branch,
         worktree_path=destination,
         tracked_remote=repo.default_remote,
@@ -127,8 +135,12 @@ def create_standard_workspace(
         updated_at=timestamp,
     )
 
-    repos = dict(metadata.repos)
-    repos[repo_key] = replace(repo, updated_at=timestamp, workspaces=updated_workspaces)
+    updated_repo = replace(
+        repo,
+        updated_at=timestamp,
+        workspaces={**repo.workspaces, branch: workspace},
+    )
+    repos = {**metadata.repos, repo_key: updated_repo}
     updated_metadata = WorkspacesMetadata(version=metadata.version, repos=repos)
 
     transaction = Transaction()
@@ -182,16 +194,11 @@ def create_octopus_workspace(
     branch: str,
     parent_refs: list[str],
     metadata_manager: MetadataManager,
+    tracked_repo: RepoMetadata | None = None,
 ) -> Path:
-    metadata_manager.ensure_repo_tracked(cwd=cwd)
-
-    repo_git_dir = canonical_git_dir(cwd)
-    repo_root_dir = repo_root(cwd)
-    if repo_git_dir is None or repo_root_dir is None:
-        raise AppError(
-            code="not-in-git-repo",
-            message="gitcuttle must be run from within a git repository",
-        )
+    repo_git_dir, repo_root_dir = _tracked_repo_paths(
+        cwd=cwd, metadata_manager=metadata_manager, tracked_repo=tracked_repo
+    )
 
     normalized_parent_refs = _normalize_octopus_parent_refs(
         cwd=repo_root_dir,
@@ -226,8 +233,7 @@ def create_octopus_workspace(
         sibling_branches=repo.workspaces.keys(),
     )
     timestamp = _utc_now_iso()
-    updated_workspaces = dict(repo.workspaces)
-    updated_workspaces[branch] = WorkspaceMetadata(
+    workspace = WorkspaceMetadata(
         branch=branch,
         worktree_path=destination,
         tracked_remote=repo.default_remote,
@@ -238,8 +244,12 @@ def create_octopus_workspace(
         updated_at=timestamp,
     )
 
-    repos = dict(metadata.repos)
-    repos[repo_key] = replace(repo, updated_at=timestamp, workspaces=updated_workspaces)
+    updated_repo = replace(
+        repo,
+        updated_at=timestamp,
+        workspaces={**repo.workspaces, branch: workspace},
+    )
+    repos = {**metadata.repos, repo_key: updated_repo}
     updated_metadata = WorkspacesMetadata(version=metadata.version, repos=repos)
 
     transaction = Transaction()
@@ -343,17 +353,64 @@ def _utc_now_iso() -> str:
     return datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _tracked_repo_paths(
+    *,
+    cwd: Path,
+    metadata_manager: MetadataManager,
+    tracked_repo: RepoMetadata | None,
+) -> tuple[Path, Path]:
+    # Callers that already resolved the tracked repo skip re-tracking it and the
+    # git dir/root lookups.
+    if tracked_repo is not None:
+        return tracked_repo.git_dir, tracked_repo.repo_root
+
+    metadata_manager.ensure_repo_tracked(cwd=cwd)
+
+    repo_git_dir = canonical_git_dir(cwd)
+    repo_root_dir = repo_root(cwd)
+    if repo_git_dir is None or repo_root_dir is None:
+        raise AppError(
+            code="not-in-git-repo",
+            message="gitcuttle must be run from within a git repository",
+        )
+    return repo_git_dir, repo_root_dir
+
+
 def _rev_parse(*, cwd: Path, ref: str) -> str | None:
     result = subprocess.run(
         ["git", "rev-parse", "--verify", ref],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=False,
         cwd=cwd,
     )
     if result.returncode != 0:
         return None
-    return result.stdout.strip()
+    return result.stdout.strip().decode("ascii")
+
+
+def _missing_refs(*, cwd: Path, refs: list[str]) -> list[str]:
+    return [
+        ref for ref, oid in zip(refs, _resolve_refs(cwd=cwd, refs=refs)) if oid is None
+    ]
+
+
+def _resolve_refs(*, cwd: Path, refs: list[str]) -> list[str | None]:
+    # One cat-file batch resolves every ref instead of forking rev-parse per ref.
+    result = subprocess.run(
+        ["git", "cat-file", "--batch-check=%(objectname)"],
+        input="".join(f"{ref}\n" for ref in refs).encode(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=False,
+        cwd=cwd,
+    )
+    lines = result.stdout.decode("utf-8", "replace").splitlines()
+    if result.returncode != 0 or len(lines) != len(refs):
+        return [_rev_parse(cwd=cwd, ref=ref) for ref in refs]
+    return [
+        None if line.endswith((" missing", " ambiguous")) else line for line in lines
+    ]
 
 
 def _local_branch_exists(*, cwd: Path, branch: str) -> bool:
@@ -473,7 +530,7 @@ def _normalize_octopus_parent_refs(*, cwd: Path, parent_refs: list[str]) -> list
             details=", ".join(normalized),
         )
 
-    missing_refs = [ref for ref in normalized if _rev_parse(cwd=cwd, ref=ref) is None]
+    missing_refs = _missing_refs(cwd=cwd, refs=normalized)
     if missing_refs:
         raise AppError(
             code="invalid-base-ref",
@@ -1,33 +1,24 @@
 import json
 import subprocess
 from pathlib import Path
-from typing import Callable, Protocol
+from typing import TYPE_CHECKING, Callable, Protocol
 
-from git_cuttle.absorb import absorb_octopus_workspace
-from git_cuttle.delete import delete_workspace
 from git_cuttle.errors import AppError
-from git_cuttle.git_ops import (
-    canonical_git_dir,
-    in_git_repo,
-    in_progress_operation,
-    repo_root,
-)
+from git_cuttle.git_ops import canonical_git_dir, in_git_repo, in_progress_operation
 from git_cuttle.lib import Options
 from git_cuttle.list_output import render_workspace_table, rows_for_repo
 from git_cuttle.metadata_manager import MetadataManager, RepoMetadata, WorkspaceMetadata
-from git_cuttle.new import (
-    create_octopus_workspace,
-    create_standard_workspace,
-    resolve_workspace_branch_name,
-)
-from git_cuttle.prune import PrStatus, prune_workspaces
 from git_cuttle.remote_status import (
     PullRequestStatusCache,
     RemoteStatusCache,
     pull_request_status_for_repo,
     remote_ahead_behind_for_repo,
 )
-from git_cuttle.update import update_non_octopus_workspace, update_octopus_workspace
+
+# Workflow modules are imported inside their `_run_*` handlers so each
+# invocation only loads the command it runs.
+if TYPE_CHECKING:
+    from git_cuttle.prune import PrStatus
 
 MUTATING_COMMANDS = frozenset({"new", "delete", "prune", "update", "absorb"})
 REMOTE_STATUS_CACHE = RemoteStatusCache()
@@ -38,6 +29,12 @@ class RepoTracker(Protocol):
     def ensure_repo_tracked(self, *, cwd: Path) -> None: ...
 
 
+class CommandHandler(Protocol):
+    def __call__(
+        self, *, opts: Options, cwd: Path, metadata_manager: MetadataManager
+    ) -> None: ...
+
+
 def command_requires_auto_tracking(command_name: str) -> bool:
     return command_name in MUTATING_COMMANDS
 
@@ -90,53 +87,14 @@ def _dispatch_command(
     cwd: Path,
     metadata_manager: RepoTracker,
 ) -> None:
-    if command_name == "new":
-        manager = (
-            metadata_manager
-            if isinstance(metadata_manager, MetadataManager)
-            else MetadataManager()
-        )
-        _run_new(opts=opts, cwd=cwd, metadata_manager=manager)
-        return
-    if command_name == "list":
+    handler = _COMMAND_HANDLERS.get(command_name)
+    if handler is not None:
         manager = (
             metadata_manager
             if isinstance(metadata_manager, MetadataManager)
             else MetadataManager()
         )
-        _run_list(opts=opts, cwd=cwd, metadata_manager=manager)
-        return
-    if command_name == "delete":
-        manager = (
-            metadata_manager
-            if isinstance(metadata_manager, MetadataManager)
-            else MetadataManager()
-        )
-        _run_delete(opts=opts, cwd=cwd, metadata_manager=manager)
-        return
-    if command_name == "prune":
-        manager = (
-            metadata_manager
-            if isinstance(metadata_manager, MetadataManager)
-            else MetadataManager()
-        )
-        _run_prune(opts=opts, cwd=cwd, metadata_manager=manager)
-        return
-    if command_name == "update":
-        manager = (
-            metadata_manager
-            if isinstance(metadata_manager, MetadataManager)
-            else MetadataManager()
-        )
-        _run_update(opts=opts, cwd=cwd, metadata_manager=manager)
-        return
-    if command_name == "absorb":
-        manager = (
-            metadata_manager
-            if isinstance(metadata_manager, MetadataManager)
-            else MetadataManager()
-        )
-        _run_absorb(opts=opts, cwd=cwd, metadata_manager=manager)
+        handler(opts=opts, cwd=cwd, metadata_manager=manager)
         return
 
     raise AppError(
@@ -148,6 +106,12 @@ def _dispatch_command(
 
 
 def _run_new(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) -> None:
+    from git_cuttle.new import (
+        create_octopus_workspace,
+        create_standard_workspace,
+        resolve_workspace_branch_name,
+    )
+
     repo = _tracked_repo_for_cwd(cwd=cwd, metadata_manager=metadata_manager)
     branch = resolve_workspace_branch_name(
         cwd=repo.repo_root,
@@ -161,6 +125,7 @@ def _run_new(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) ->
             branch=branch,
             parent_refs=list(opts.parent_refs),
             metadata_manager=metadata_manager,
+            tracked_repo=repo,
         )
     else:
         destination = create_standard_workspace(
@@ -168,14 +133,14 @@ def _run_new(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) ->
             branch=branch,
             base_ref=opts.base_ref,
             metadata_manager=metadata_manager,
+            tracked_repo=repo,
         )
 
     if opts.destination:
         print(destination)
         return
 
-    print(f"created workspace '{branch}' at {destination}")
-    print(f"hint: cd {destination}")
+    print(f"created workspace '{branch}' at {destination}\nhint: cd {destination}")
 
 
 def _run_list(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) -> None:
@@ -228,15 +193,19 @@ def _run_list(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) ->
 def _tracked_repo_for_list(
     *, cwd: Path, metadata_manager: MetadataManager
 ) -> RepoMetadata | None:
+    metadata = metadata_manager.read()
+    if not metadata.repos:
+        return None
+
     repo_git_dir = canonical_git_dir(cwd)
     if repo_git_dir is None:
         return None
-
-    metadata = metadata_manager.read()
     return metadata.repos.get(str(repo_git_dir))
 
 
 def _run_delete(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) -> None:
+    from git_cuttle.delete import delete_workspace
+
     if opts.branch is None:
         raise AppError(
             code="invalid-arguments",
@@ -257,6 +226,8 @@ def _run_delete(*, opts: Options, cwd: Path, metadata_manager: MetadataManager)
 
 
 def _run_prune(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) -> None:
+    from git_cuttle.prune import prune_workspaces
+
     tracked_repo = _tracked_repo_for_cwd(cwd=cwd, metadata_manager=metadata_manager)
     pull_request_statuses = PULL_REQUEST_STATUS_CACHE.statuses_for_repo(
         repo=tracked_repo,
@@ -287,6 +258,11 @@ def _run_prune(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) -
 
 
 def _run_update(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) -> None:
+    from git_cuttle.update import (
+        update_non_octopus_workspace,
+        update_octopus_workspace,
+    )
+
     _ = opts
     repo = _tracked_repo_for_cwd(cwd=cwd, metadata_manager=metadata_manager)
     workspace = _current_workspace(cwd=cwd, repo=repo)
@@ -355,16 +331,14 @@ def _current_workspace(*, cwd: Path, repo: RepoMetadata) -> WorkspaceMetadata:
 
 
 def _current_branch(*, cwd: Path) -> str | None:
-    root = repo_root(cwd)
-    if root is None:
-        return None
-
+    # rev-parse resolves HEAD from any subdirectory and fails outside a repo, so
+    # no separate repo_root lookup is needed.
     result = subprocess.run(
         ["git", "rev-parse", "--abbrev-ref", "HEAD"],
         capture_output=True,
         text=True,
         check=False,
-        cwd=root,
+        cwd=cwd,
     )
     if result.returncode != 0:
         return None
@@ -390,6 +364,8 @@ def _git_stdout(*, repo_root: Path, args: list[str], code: str, message: str) ->
 
 
 def _run_absorb(*, opts: Options, cwd: Path, metadata_manager: MetadataManager) -> None:
+    from git_cuttle.absorb import absorb_octopus_workspace
+
     if opts.target_parent is not None and opts.interactive:
         raise AppError(
             code="invalid-absorb-options",
@@ -433,9 +409,11 @@ def _interactive_target_selector(
             message="failed to read commit details during interactive absorb",
         )
         short_oid = commit[:12]
-        print(f"choose parent branch for {short_oid}: {subject}")
-        for index, parent in enumerate(parents, start=1):
-            print(f"  {index}) {parent}")
+        prompt_lines = [f"choose parent branch for {short_oid}: {subject}"]
+        prompt_lines.extend(
+            f"  {index}) {parent}" for index, parent in enumerate(parents, start=1)
+        )
+        print("\n".join(prompt_lines))
 
         try:
             selection = input("target parent> ").strip()
@@ -470,3 +448,13 @@ def _interactive_target_selector(
         return selected_parent
 
     return choose_target
+
+
+_COMMAND_HANDLERS: dict[str, CommandHandler] = {
+    "new": _run_new,
+    "list": _run_list,
+    "delete": _run_delete,
+    "prune": _run_prune,
+    "update": _run_update,
+    "absorb": _run_absorb,
+}
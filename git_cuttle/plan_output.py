@@ -2,14 +2,14 @@ import json
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class PlanAction:
     op: str
     target: str
     details: str | None = None
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class DryRunPlan:
     command: str
     actions: tuple[PlanAction, ...]
@@ -37,18 +37,20 @@ def render_human_plan(plan: DryRunPlan) -> str:
 
 
 def render_json_plan(plan: DryRunPlan) -> str:
+    # Keys are laid out already sorted, so the output matches sort_keys=True
+    # without json re-sorting every dict.
     payload = {
-        "command": plan.command,
-        "dry_run": True,
         "action_count": len(plan.actions),
         "actions": [
             {
+                "details": action.details,
                 "op": action.op,
                 "target": action.target,
-                "details": action.details,
             }
             for action in plan.actions
         ],
+        "command": plan.command,
+        "dry_run": True,
         "warnings": list(plan.warnings),
     }
-    return json.dumps(payload, indent=2, sort_keys=True)
+    return json.dumps(payload, indent=2)
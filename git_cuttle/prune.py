@@ -1,10 +1,17 @@
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Literal
 
 from git_cuttle.errors import AppError
-from git_cuttle.git_ops import add_worktree, canonical_git_dir, repo_root
+from git_cuttle.git_ops import (
+    add_worktree,
+    canonical_git_dir,
+    head_branch,
+    local_branch_names,
+    repo_root,
+)
 from git_cuttle.metadata_manager import (
     MetadataManager,
     WorkspaceMetadata,
@@ -33,9 +40,10 @@ PruneBlockReason = Literal[
     "no-upstream",
     "ahead-of-upstream",
 ]
+_MAX_PROBE_WORKERS = 8
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class PruneDecision:
     branch: str
     reason: PruneReason
@@ -44,7 +52,7 @@ class PruneDecision:
     worktree_path: Path
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class PruneCandidate:
     branch: str
     local_branch_exists: bool
@@ -101,10 +109,6 @@ def prune_workspaces(
 
     metadata = metadata_manager.read()
     repo = metadata.repos.get(str(repo_git_dir))
-    if repo is None:
-        common_git_dir = _git_common_dir(cwd=cwd)
-        if common_git_dir is not None:
-            repo = metadata.repos.get(str(common_git_dir))
     if repo is None:
         raise AppError(
             code="repo-not-tracked",
@@ -142,8 +146,7 @@ def prune_workspaces(
         if name not in pruned_branches
     }
     updated_repo = replace(repo, workspaces=updated_workspaces)
-    updated_repos = dict(metadata.repos)
-    updated_repos[repo_key] = updated_repo
+    updated_repos = {**metadata.repos, repo_key: updated_repo}
 
     updated_metadata = WorkspacesMetadata(version=metadata.version, repos=updated_repos)
     transaction = Transaction()
@@ -215,23 +218,6 @@ def prune_workspaces(
     return None
 
 
-def _git_common_dir(*, cwd: Path) -> Path | None:
-    result = subprocess.run(
-        ["git", "rev-parse", "--git-common-dir"],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=cwd,
-    )
-    if result.returncode != 0:
-        return None
-
-    common = Path(result.stdout.strip())
-    if common.is_absolute():
-        return common.resolve(strict=False)
-    return (cwd / common).resolve(strict=False)
-
-
 def _prune_decisions(
     *,
     repo_root: Path,
@@ -241,39 +227,63 @@ def _prune_decisions(
     default_remote: str | None,
     repo_workspaces: dict[str, WorkspaceMetadata],
 ) -> tuple[PruneDecision, ...]:
-    decisions: list[PruneDecision] = []
+    # One for-each-ref answers branch existence for every tracked workspace.
+    existing_branches = local_branch_names(repo_root)
+    candidates: list[tuple[WorkspaceMetadata, PruneCandidate, PruneReason]] = []
     for branch, workspace in sorted(repo_workspaces.items()):
-        candidate = prune_candidate_for_branch(
-            repo_root=repo_root,
-            branch=branch,
-            pr_status=statuses.get(branch),
-        )
+        if existing_branches is None:
+            candidate = prune_candidate_for_branch(
+                repo_root=repo_root,
+                branch=branch,
+                pr_status=statuses.get(branch),
+            )
+        else:
+            candidate = PruneCandidate(
+                branch=branch,
+                local_branch_exists=branch in existing_branches,
+                pr_status=statuses.get(branch),
+            )
         reason = prune_reason(candidate)
-        if reason is None:
-            continue
-
-        worktree_path = workspace.worktree_path
-        block_reason = prune_block_reason(
+        if reason is not None:
+            candidates.append((workspace, candidate, reason))
+
+    def block_reason_for(
+        entry: tuple[WorkspaceMetadata, PruneCandidate, PruneReason],
+    ) -> PruneBlockReason | None:
+        workspace, candidate, reason = entry
+        return prune_block_reason(
             current=current,
-            target=branch,
-            worktree_path=worktree_path,
+            target=candidate.branch,
+            worktree_path=workspace.worktree_path,
             force=force,
             reason=reason,
             repo_root=repo_root,
             tracked_remote=workspace.tracked_remote,
             default_remote=default_remote,
         )
-        decisions.append(
-            PruneDecision(
-                branch=branch,
-                reason=reason,
-                block_reason=block_reason,
-                local_branch_exists=candidate.local_branch_exists,
-                worktree_path=worktree_path,
-            )
-        )
 
-    return tuple(decisions)
+    # Block checks fork up to three git processes per workspace and touch no
+    # shared state, so threads overlap their waits.
+    workers = 1 if force else min(_MAX_PROBE_WORKERS, len(candidates))
+    block_reasons: list[PruneBlockReason | None]
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            block_reasons = list(pool.map(block_reason_for, candidates))
+    else:
+        block_reasons = [block_reason_for(entry) for entry in candidates]
+
+    return tuple(
+        PruneDecision(
+            branch=candidate.branch,
+            reason=reason,
+            block_reason=block_reason,
+            local_branch_exists=candidate.local_branch_exists,
+            worktree_path=workspace.worktree_path,
+        )
+        for (workspace, candidate, reason), block_reason in zip(
+            candidates, block_reasons
+        )
+    )
 
 
 def prune_block_reason(
@@ -304,9 +314,6 @@ def prune_block_reason(
     if upstream_ref is None:
         return "no-upstream"
 
-    if not _ref_exists(repo_root=repo_root, ref=f"refs/remotes/{upstream_ref}"):
-        return "no-upstream"
-
     ahead = _ahead_count(
         repo_root=repo_root, local_branch=target, upstream_ref=upstream_ref
     )
@@ -327,27 +334,18 @@ def _workspace_upstream_ref(
     return f"{remote_name}/{branch}"
 
 
-def _ref_exists(*, repo_root: Path, ref: str) -> bool:
-    result = subprocess.run(
-        ["git", "rev-parse", "--verify", ref],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=repo_root,
-    )
-    return result.returncode == 0
-
-
 def _ahead_count(
     *, repo_root: Path, local_branch: str, upstream_ref: str
 ) -> int | None:
+    # Fully qualified refs make rev-list fail when either side is missing,
+    # which covers the upstream existence check.
     result = subprocess.run(
         [
             "git",
             "rev-list",
             "--left-right",
             "--count",
-            f"{local_branch}...{upstream_ref}",
+            f"refs/heads/{local_branch}...refs/remotes/{upstream_ref}",
         ],
         capture_output=True,
         text=True,
@@ -404,27 +402,16 @@ def _build_prune_plan(
 
 
 def current_branch(*, cwd: Path) -> str | None:
-    result = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=cwd,
-    )
-    if result.returncode != 0:
-        return None
-
-    branch = result.stdout.strip()
-    if branch == "" or branch == "HEAD":
-        return None
-    return branch
+    return head_branch(cwd)
 
 
 def _worktree_has_uncommitted_changes(*, cwd: Path) -> bool:
+    # Untracked files must block removal, which diff-index cannot see; instead
+    # skip status's index write-back and rename detection.
     result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True,
-        text=True,
+        ["git", "--no-optional-locks", "status", "--porcelain", "--no-renames"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=False,
         cwd=cwd,
     )
@@ -591,11 +578,11 @@ def _delete_branch_step(
 def _branch_head_oid(*, repo_root: Path, branch: str) -> str | None:
     result = subprocess.run(
         ["git", "rev-parse", "--verify", f"refs/heads/{branch}"],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=False,
         cwd=repo_root,
     )
     if result.returncode != 0:
         return None
-    return result.stdout.strip()
+    return result.stdout.strip().decode("ascii")
@@ -1,4 +1,5 @@
 import json
+import re
 import subprocess
 import time
 from dataclasses import dataclass
@@ -9,7 +10,7 @@ from urllib.parse import urlparse
 from git_cuttle.metadata_manager import RepoMetadata, WorkspaceMetadata
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class RemoteAheadBehindStatus:
     branch: str
     upstream_ref: str | None
@@ -37,6 +38,8 @@ class PullRequestStatus:
         return self.state in {"draft", "open", "closed", "merged"}
 
 
+_TRACK_COUNT_PATTERN = re.compile(r"(ahead|behind) (\d+)")
+
 StatusResolver = Callable[[RepoMetadata], dict[str, "RemoteAheadBehindStatus"]]
 PrStatusResolver = Callable[[RepoMetadata], dict[str, "PullRequestStatus"]]
 
@@ -72,7 +75,8 @@ class RemoteStatusCache:
         now = self.now()
         if cached is not None:
             fetched_at, statuses = cached
-            if now - fetched_at < self.ttl_seconds:
+            # An entry stamped in the future (clock skew) is a miss.
+            if 0 <= now - fetched_at < self.ttl_seconds:
                 return statuses
 
         statuses = resolver(repo)
@@ -110,8 +114,28 @@ class PullRequestStatusCache:
 def remote_ahead_behind_for_repo(
     *, repo: RepoMetadata
 ) -> dict[str, RemoteAheadBehindStatus]:
+    # One for-each-ref reports ahead/behind for every branch whose configured
+    # upstream is the one metadata expects; the rest fall back to rev-list.
+    tracking = _branch_tracking_counts(repo_root=repo.repo_root)
     statuses: dict[str, RemoteAheadBehindStatus] = {}
     for branch, workspace in repo.workspaces.items():
+        upstream_ref = _workspace_upstream_ref(
+            workspace=workspace, default_remote=repo.default_remote
+        )
+        tracked = tracking.get(workspace.branch)
+        if (
+            upstream_ref is not None
+            and tracked is not None
+            and tracked[0] == f"refs/remotes/{upstream_ref}"
+        ):
+            statuses[branch] = RemoteAheadBehindStatus(
+                branch=workspace.branch,
+                upstream_ref=upstream_ref,
+                ahead=tracked[1],
+                behind=tracked[2],
+            )
+            continue
+
         statuses[branch] = remote_ahead_behind_for_workspace(
             repo_root=repo.repo_root,
             workspace=workspace,
@@ -149,15 +173,12 @@ def remote_ahead_behind_for_workspace(
     if upstream_ref is None:
         return unknown
 
-    local_ref = f"refs/heads/{workspace.branch}"
-    remote_ref = f"refs/remotes/{upstream_ref}"
-    if not _ref_exists(repo_root=repo_root, ref=local_ref):
-        return unknown
-    if not _ref_exists(repo_root=repo_root, ref=remote_ref):
-        return unknown
-
+    # rev-list fails when either fully qualified ref is missing, which stands
+    # in for separate existence checks.
     counts = _ahead_behind_counts(
-        repo_root=repo_root, local_branch=workspace.branch, upstream_ref=upstream_ref
+        repo_root=repo_root,
+        local_ref=f"refs/heads/{workspace.branch}",
+        remote_ref=f"refs/remotes/{upstream_ref}",
     )
     if counts is None:
         return unknown
@@ -366,19 +387,8 @@ def _pull_request_status_from_gh(
     )
 
 
-def _ref_exists(*, repo_root: Path, ref: str) -> bool:
-    result = subprocess.run(
-        ["git", "rev-parse", "--verify", ref],
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=repo_root,
-    )
-    return result.returncode == 0
-
-
 def _ahead_behind_counts(
-    *, repo_root: Path, local_branch: str, upstream_ref: str
+    *, repo_root: Path, local_ref: str, remote_ref: str
 ) -> tuple[int, int] | None:
     result = subprocess.run(
         [
@@ -386,7 +396,7 @@ def _ahead_behind_counts(
             "rev-list",
             "--left-right",
             "--count",
-            f"{local_branch}...{upstream_ref}",
+            f"{local_ref}...{remote_ref}",
         ],
         capture_output=True,
         text=True,
@@ -407,3 +417,35 @@ def _ahead_behind_counts(
         return None
 
     return ahead, behind
+
+
+def _branch_tracking_counts(*, repo_root: Path) -> dict[str, tuple[str, int, int]]:
+    result = subprocess.run(
+        [
+            "git",
+            "for-each-ref",
+            "--format=%(refname:lstrip=2)%00%(upstream)%00%(upstream:track,nobracket)",
+            "refs/heads/",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=repo_root,
+    )
+    if result.returncode != 0:
+        return {}
+
+    tracking: dict[str, tuple[str, int, int]] = {}
+    for line in result.stdout.splitlines():
+        parts = line.split("\0")
+        if len(parts) != 3:
+            continue
+        branch, upstream, track = parts
+        # "gone" means the upstream ref is missing; leave it to the fallback.
+        if not upstream or track == "gone":
+            continue
+        counts = dict.fromkeys(("ahead", "behind"), 0)
+        for direction, count in _TRACK_COUNT_PATTERN.findall(track):
+            counts[direction] = int(count)
+        tracking[branch] = (upstream, counts["ahead"], counts["behind"])
+    return tracking
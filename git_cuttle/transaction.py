@@ -1,7 +1,6 @@
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import cast
-from uuid import uuid4
 
 
 @dataclass(kw_only=True, frozen=True)
@@ -88,9 +87,17 @@ class TransactionRollbackError(RuntimeError):
         )
 
 
+def _new_txn_id() -> str:
+    # uuid pulls in platform probing at import time; the CLI entry point imports
+    # this module for its error type, so defer uuid until a transaction starts.
+    from uuid import uuid4
+
+    return uuid4().hex
+
+
 @dataclass(kw_only=True)
 class Transaction:
-    txn_id: str = field(default_factory=lambda: uuid4().hex)
+    txn_id: str = field(default_factory=_new_txn_id)
     _steps: list[TransactionStep] = field(
         default_factory=lambda: cast(list[TransactionStep], [])
     )
@@ -149,7 +156,7 @@ def run_transaction(
     steps: Iterable[TransactionStep],
     txn_id: str | None = None,
 ) -> str:
-    transaction = Transaction(txn_id=txn_id or uuid4().hex)
+    transaction = Transaction(txn_id=txn_id or _new_txn_id())
     transaction.add_steps(steps)
     transaction.run()
     return transaction.txn_id
@@ -458,7 +458,7 @@ def _octopus_replay_commits(
     *, repo_root: Path, branch: str, parent_refs: tuple[str, ...]
 ) -> list[str]:
     result = subprocess.run(
-        ["git", "rev-list", "--reverse", branch, "--not", *parent_refs],
+        ["git", "rev-list", "--reverse", "--parents", branch, "--not", *parent_refs],
         capture_output=True,
         text=True,
         check=False,
@@ -472,11 +472,13 @@ def _octopus_replay_commits(
             details=details,
         )
 
-    commits = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-    if not commits:
+    # Each line is "<oid> <parent>..." so merge-ness needs no extra git call.
+    entries = [line.split() for line in result.stdout.splitlines() if line.strip()]
+    if not entries:
         return []
 
-    if _is_merge_commit(repo_root=repo_root, commit=commits[0]):
+    commits = [entry[0] for entry in entries]
+    if len(entries[0]) > 2:
         return commits[1:]
     return commits
 
@@ -496,14 +498,6 @@ def _ensure_workspace_clean_for_octopus_update(*, workspace: WorkspaceMetadata)
     )
 
 
-def _is_merge_commit(*, repo_root: Path, commit: str) -> bool:
-    parent_line = _git_stdout(
-        repo_root=repo_root, args=["show", "-s", "--format=%P", commit]
-    )
-    parent_oids = [parent for parent in parent_line.split() if parent]
-    return len(parent_oids) > 1
-
-
 def _worktree_has_uncommitted_changes(*, cwd: Path) -> bool:
     result = subprocess.run(
         ["git", "status", "--porcelain"],
@@ -592,14 +586,14 @@ def _checkout_branch(*, repo_root: Path, branch: str) -> None:
 def _rev_parse(*, repo_root: Path, ref: str) -> str | None:
     result = subprocess.run(
         ["git", "rev-parse", "--verify", ref],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=False,
         cwd=repo_root,
     )
     if result.returncode != 0:
         return None
-    return result.stdout.strip()
+    return result.stdout.strip().decode("ascii")
 
 
 def _git(*, repo_root: Path, args: list[str], code: str, message: str) -> None:
@@ -0,0 +1,9 @@
+import pytest
+
+from git_cuttle import git_ops
+
+
+@pytest.fixture(autouse=True)
+def _clear_repo_path_cache() -> None:
+    # Repo path lookups are memoized per process; start every test cold.
+    git_ops._rev_parse_paths.cache_clear()  # pyright: ignore[reportPrivateUsage]
@@ -160,6 +160,98 @@ def test_absorb_interactive_mode_uses_selected_parent(tmp_path: Path) -> None:
     assert main_log == "picked-main"
 
 
+@pytest.mark.integration
+def test_absorb_interactive_mode_applies_interleaved_targets_in_order(
+    tmp_path: Path,
+) -> None:
+    repo, workspace = _setup_octopus_repo(tmp_path)
+
+    targets = {"main-1": "main", "release-1": "release", "main-2": "main"}
+    for name in targets:
+        (repo / f"{name}.txt").write_text(f"{name}\n")
+        _git(cwd=repo, args=["add", f"{name}.txt"])
+        _git(cwd=repo, args=["commit", "-m", name])
+
+    def choose_target(commit: str, parents: tuple[str, ...]) -> str:
+        _ = parents
+        subject = _git(
+            cwd=repo, args=["show", "-s", "--format=%s", commit]
+        ).stdout.strip()
+        return targets[subject]
+
+    result = absorb_octopus_workspace(
+        repo_root=repo,
+        workspace=workspace,
+        interactive=True,
+        choose_target=choose_target,
+    )
+
+    assert [entry.target_parent for entry in result.absorbed_commits] == [
+        "main",
+        "release",
+        "main",
+    ]
+    main_log = _git(
+        cwd=repo, args=["log", "--format=%s", "-n", "2", "main"]
+    ).stdout.splitlines()
+    assert main_log == ["main-2", "main-1"]
+    release_log = _git(
+        cwd=repo, args=["log", "--format=%s", "-n", "1", "release"]
+    ).stdout.strip()
+    assert release_log == "release-1"
+
+
+@pytest.mark.integration
+def test_absorb_rolls_back_parent_when_later_pick_in_group_conflicts(
+    tmp_path: Path,
+) -> None:
+    repo, workspace = _setup_octopus_repo(tmp_path)
+    main_before = _git(cwd=repo, args=["rev-parse", "main"]).stdout.strip()
+
+    (repo / "main-1.txt").write_text("main-1\n")
+    _git(cwd=repo, args=["add", "main-1.txt"])
+    _git(cwd=repo, args=["commit", "-m", "main-1"])
+    (repo / "release.txt").write_text("release v2\n")
+    _git(cwd=repo, args=["add", "release.txt"])
+    _git(cwd=repo, args=["commit", "-m", "main-2"])
+
+    with pytest.raises(AppError) as exc_info:
+        absorb_octopus_workspace(
+            repo_root=repo,
+            workspace=workspace,
+            interactive=True,
+            choose_target=lambda commit, parents: "main",
+        )
+
+    assert exc_info.value.code == "absorb-cherry-pick-failed"
+    assert _git(cwd=repo, args=["rev-parse", "main"]).stdout.strip() == main_before
+    current = _git(cwd=repo, args=["branch", "--show-current"]).stdout.strip()
+    assert current == workspace.branch
+    git_dir = repo / ".git"
+    assert not (git_dir / "sequencer").exists()
+    assert not (git_dir / "CHERRY_PICK_HEAD").exists()
+    assert _git(cwd=repo, args=["status", "--porcelain"]).stdout == ""
+
+
+@pytest.mark.integration
+def test_absorb_heuristic_mode_targets_parent_that_owns_changed_files(
+    tmp_path: Path,
+) -> None:
+    repo, workspace = _setup_octopus_repo(tmp_path)
+
+    (repo / "release.txt").write_text("release v2\n")
+    _git(cwd=repo, args=["add", "release.txt"])
+    _git(cwd=repo, args=["commit", "-m", "release follow-up"])
+
+    result = absorb_octopus_workspace(repo_root=repo, workspace=workspace)
+
+    assert [entry.target_parent for entry in result.absorbed_commits] == ["release"]
+    release_log = _git(
+        cwd=repo, args=["log", "--format=%s", "-n", "1", "release"]
+    ).stdout.strip()
+    assert release_log == "release follow-up"
+
+
 @pytest.mark.integration
 def test_absorb_heuristic_mode_fails_when_target_is_ambiguous(tmp_path: Path) -> None:
     repo, workspace = _setup_octopus_repo(tmp_path)
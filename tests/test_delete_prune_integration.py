@@ -1,3 +1,4 @@
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -62,6 +63,16 @@ def test_delete_blocks_current_workspace_without_force(tmp_path: Path) -> None:
     )
 
 
+@pytest.mark.integration
+def test_current_branch_is_none_for_detached_head(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+    _git(cwd=repo, args=["checkout", "--detach"])
+
+    assert current_branch(cwd=repo) is None
+
+
 @pytest.mark.integration
 def test_prune_marks_missing_local_branch_as_candidate(tmp_path: Path) -> None:
     repo = tmp_path / "repo"
@@ -405,6 +416,58 @@ def test_delete_blocks_without_upstream_unless_forced(tmp_path: Path) -> None:
     )
 
 
+@pytest.mark.integration
+def test_delete_skips_dirty_check_when_worktree_directory_is_missing(
+    tmp_path: Path,
+) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+
+    metadata_path = tmp_path / "workspaces.json"
+    manager = MetadataManager(path=metadata_path)
+    create_standard_workspace(
+        cwd=repo,
+        branch="feature/gone",
+        base_ref="main",
+        metadata_manager=manager,
+    )
+    (repo_metadata,) = manager.read().repos.values()
+    shutil.rmtree(repo_metadata.workspaces["feature/gone"].worktree_path)
+
+    with pytest.raises(AppError) as exc_info:
+        delete_workspace(cwd=repo, branch="feature/gone", metadata_manager=manager)
+
+    assert exc_info.value.code == "no-upstream"
+
+
+@pytest.mark.integration
+def test_delete_fails_when_worktree_path_cannot_be_inspected(
+    tmp_path: Path,
+) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+
+    metadata_path = tmp_path / "workspaces.json"
+    manager = MetadataManager(path=metadata_path)
+    create_standard_workspace(
+        cwd=repo,
+        branch="feature/not-a-dir",
+        base_ref="main",
+        metadata_manager=manager,
+    )
+    (repo_metadata,) = manager.read().repos.values()
+    worktree_path = repo_metadata.workspaces["feature/not-a-dir"].worktree_path
+    shutil.rmtree(worktree_path)
+    worktree_path.write_text("not a directory\n")
+
+    with pytest.raises(AppError) as exc_info:
+        delete_workspace(cwd=repo, branch="feature/not-a-dir", metadata_manager=manager)
+
+    assert exc_info.value.code == "workspace-status-failed"
+
+
 @pytest.mark.integration
 def test_delete_dry_run_matches_mutating_block_without_upstream(
     tmp_path: Path,
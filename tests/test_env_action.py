@@ -2,9 +2,11 @@ import argparse
 import os
 from pathlib import Path
 
+import pytest
 from dotenv import load_dotenv
 
 from git_cuttle.__main__ import EnvAction
+from git_cuttle.cli import CliOpts, build_parser
 
 
 def test_env_action_basic() -> None:
@@ -133,3 +135,38 @@ def test_env_action_default() -> None:
 
     # Clean up
     del os.environ["TEST_DEFAULT_VAR"]
+
+
+def test_cli_parser_is_reused_until_verbose_env_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("GITCUTTLE_VERBOSE", raising=False)
+    parser = build_parser()
+    assert build_parser() is parser
+    assert parser.parse_args(["list"]).verbose is None
+
+    monkeypatch.setenv("GITCUTTLE_VERBOSE", "1")
+    verbose_parser = build_parser()
+    assert verbose_parser is not parser
+    assert verbose_parser.parse_args(["list"]).verbose == "1"
+
+
+def test_cli_parser_for_known_command_parses_like_full_parser() -> None:
+    argv = ["delete", "feature/demo", "--dry-run"]
+    partial = build_parser(command="delete").parse_args(argv)
+    full = build_parser().parse_args(argv)
+
+    assert vars(partial) == vars(full)
+    assert build_parser(command="unknown") is build_parser()
+
+
+def test_cli_opts_parse_is_cached_per_argv_and_verbose_env(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("GITCUTTLE_VERBOSE", raising=False)
+    quiet = CliOpts.parse_args(["list", "--json"])
+    assert CliOpts.parse_args(["list", "--json"]) is quiet
+    assert not quiet.verbose
+
+    monkeypatch.setenv("GITCUTTLE_VERBOSE", "1")
+    assert CliOpts.parse_args(["list", "--json"]).verbose
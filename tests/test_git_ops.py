@@ -5,9 +5,14 @@ import pytest
 
 from git_cuttle.git_ops import (
     backup_ref_for_branch,
+    canonical_git_dir,
     create_backup_refs_for_branches,
+    head_branch,
+    in_git_repo,
     in_progress_operation,
+    local_branch_names,
     remove_backup_refs,
+    repo_root,
 )
 
 
@@ -24,6 +29,105 @@ def _init_repo(path: pathlib.Path) -> None:
     subprocess.run(["git", "commit", "-m", "init"], check=True, cwd=path)
 
 
+def test_in_git_repo_detects_repo_root_and_subdirectories(
+    tmp_path: pathlib.Path,
+) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+    nested = repo / "nested"
+    nested.mkdir()
+
+    assert in_git_repo(repo)
+    assert in_git_repo(nested)
+    assert not in_git_repo(tmp_path)
+
+
+def test_in_git_repo_rejects_empty_or_dangling_dot_git(
+    tmp_path: pathlib.Path,
+) -> None:
+    empty = tmp_path / "empty"
+    (empty / ".git").mkdir(parents=True)
+    dangling = tmp_path / "dangling"
+    dangling.mkdir()
+    (dangling / ".git").write_text(f"gitdir: {tmp_path / 'missing'}\n")
+
+    assert not in_git_repo(empty)
+    assert not in_git_repo(dangling)
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+    worktree = tmp_path / "worktree"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "feature/wt", str(worktree)],
+        check=True,
+        cwd=repo,
+    )
+    assert in_git_repo(worktree)
+
+
+def test_repo_root_caches_hits_but_not_misses(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    assert repo_root(repo) is None
+    _init_repo(repo)
+    assert repo_root(repo) == repo.resolve()
+
+    def fail_run(*args: object, **kwargs: object) -> None:
+        raise AssertionError("repo paths should be served from the cache")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+    assert repo_root(repo) == repo.resolve()
+    assert canonical_git_dir(repo) == (repo / ".git").resolve()
+
+
+def test_local_branch_names_lists_every_local_branch(tmp_path: pathlib.Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+    subprocess.run(["git", "branch", "feature/demo"], check=True, cwd=repo)
+
+    assert local_branch_names(repo) == frozenset({"main", "feature/demo"})
+    assert local_branch_names(tmp_path) is None
+
+
+def test_head_branch_reads_each_worktree_head(tmp_path: pathlib.Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+    worktree = tmp_path / "feature"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "feature/head", str(worktree)],
+        check=True,
+        cwd=repo,
+    )
+
+    assert head_branch(repo) == "main"
+    assert head_branch(worktree) == "feature/head"
+
+    subprocess.run(["git", "checkout", "--detach"], check=True, cwd=worktree)
+    assert head_branch(worktree) is None
+
+
+def test_head_branch_is_none_for_unborn_head_and_reads_packed_refs(
+    tmp_path: pathlib.Path,
+) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-b", "main"], check=True, cwd=repo)
+
+    assert head_branch(repo) is None
+
+    _init_repo(repo)
+    subprocess.run(["git", "pack-refs", "--all"], check=True, cwd=repo)
+    assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+    assert head_branch(repo) == "main"
+
+
 def test_in_progress_operation_returns_none_when_repo_is_clean(
     tmp_path: pathlib.Path,
 ) -> None:
@@ -112,6 +216,31 @@ def test_create_backup_refs_for_branches_fails_for_missing_branch(
         )
 
 
+def test_create_backup_refs_for_branches_requires_exact_branch_names(
+    tmp_path: pathlib.Path,
+) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+    subprocess.run(["git", "branch", "feature/one"], check=True, cwd=repo)
+
+    with pytest.raises(RuntimeError, match="branch does not exist: feature"):
+        create_backup_refs_for_branches(
+            txn_id="txn-123",
+            branches=["main", "feature"],
+            cwd=repo,
+        )
+
+    created = subprocess.run(
+        ["git", "for-each-ref", "--format=%(refname)", "refs/gitcuttle/txn/txn-123"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=repo,
+    )
+    assert created.stdout == ""
+
+
 def test_remove_backup_refs_removes_only_transaction_refs(
     tmp_path: pathlib.Path,
 ) -> None:
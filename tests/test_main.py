@@ -1,3 +1,6 @@
+import os
+from pathlib import Path
+
 import pytest
 
 from git_cuttle.__main__ import main
@@ -53,3 +56,28 @@ def test_main_surfaces_transaction_partial_state_recovery_contract(
         "git branch -f feature/demo refs/gitcuttle/txn/txn-cli-rollback/heads/feature/demo"
         in stderr
     )
+
+
+def test_main_skips_dotenv_when_requested(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    (tmp_path / ".env").write_text("GITCUTTLE_DOTENV_PROBE=loaded\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITCUTTLE_DOTENV_PROBE", raising=False)
+    monkeypatch.setenv("GITCUTTLE_SKIP_DOTENV", "1")
+    monkeypatch.setattr(
+        CliOpts,
+        "parse_args",
+        staticmethod(
+            lambda: CliOpts(app_opts=Options(), command_name="list", verbose=False)
+        ),
+    )
+
+    def run_noop(*_: object, **__: object) -> None:
+        return None
+
+    monkeypatch.setattr("git_cuttle.__main__.run", run_noop)
+
+    main()
+
+    assert "GITCUTTLE_DOTENV_PROBE" not in os.environ
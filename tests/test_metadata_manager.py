@@ -1,5 +1,9 @@
+import errno
 import json
+import os
+import stat
 import subprocess
+import time
 from pathlib import Path
 
 import pytest
@@ -91,6 +95,25 @@ def test_write_and_read_round_trip(tmp_path: Path) -> None:
     assert actual == expected
 
 
+def test_read_reuses_parsed_metadata_until_file_changes(tmp_path: Path) -> None:
+    manager = MetadataManager(path=tmp_path / "meta" / "workspaces.json")
+    written = _metadata()
+    manager.write(written)
+    written_text = manager.path.read_text()
+
+    cached = manager.read()
+    assert cached == written
+    assert cached is not written
+    assert manager.read() is cached
+    assert manager == MetadataManager(path=manager.path)
+
+    manager.write(WorkspacesMetadata(version=SCHEMA_VERSION, repos={}))
+    assert manager.read().repos == {}
+
+    manager.path.write_text(written_text)
+    assert manager.read() == written
+
+
 def test_write_failure_does_not_clobber_existing_metadata(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -129,6 +152,42 @@ def test_write_failure_does_not_clobber_existing_metadata(
     assert temp_files == []
 
 
+def test_write_does_not_follow_planted_temp_file_symlink(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    meta_dir = tmp_path / "meta"
+    meta_dir.mkdir()
+    target = tmp_path / "victim.txt"
+    target.write_text("untouched\n")
+    monkeypatch.setattr("git_cuttle.metadata_manager.os.getpid", lambda: 4242)
+    monkeypatch.setattr("git_cuttle.metadata_manager.threading.get_ident", lambda: 7)
+    (meta_dir / ".workspaces.json.4242.7.0.tmp").symlink_to(target)
+
+    manager = MetadataManager(path=meta_dir / "workspaces.json")
+    manager.write(_metadata())
+
+    assert target.read_text() == "untouched\n"
+    assert MetadataManager(path=manager.path).read() == _metadata()
+
+
+def test_write_tolerates_filesystems_without_directory_fsync(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager = MetadataManager(path=tmp_path / "meta" / "workspaces.json")
+    real_fsync = os.fsync
+
+    def file_only_fsync(fd: int) -> None:
+        if stat.S_ISDIR(os.fstat(fd).st_mode):
+            raise OSError(errno.EINVAL, "Invalid argument")
+        real_fsync(fd)
+
+    monkeypatch.setattr("git_cuttle.metadata_manager.os.fsync", file_only_fsync)
+
+    manager.write(_metadata())
+
+    assert MetadataManager(path=manager.path).read() == _metadata()
+
+
 def test_write_validates_repo_key_matches_canonical_git_dir(tmp_path: Path) -> None:
     manager = MetadataManager(path=tmp_path / "workspaces.json")
 
@@ -276,6 +335,46 @@ def test_read_migrates_legacy_schema_and_creates_backup(tmp_path: Path) -> None:
     assert backups[0].read_text() == original_text
 
 
+def test_migration_backup_does_not_overwrite_existing_backups(
+    tmp_path: Path,
+) -> None:
+    metadata_path = tmp_path / "workspaces.json"
+    original_text = json.dumps({"version": 0, "repos": {}}, indent=2)
+    metadata_path.write_text(original_text)
+    now = int(time.time())
+    existing = [tmp_path / f"workspaces.json.bak.{now + offset}" for offset in range(3)]
+    for backup in existing:
+        backup.write_text("older backup")
+
+    MetadataManager(path=metadata_path).read()
+
+    backups = set(tmp_path.glob("workspaces.json.bak.*"))
+    new_backups = backups - set(existing)
+    assert len(new_backups) == 1
+    assert new_backups.pop().read_text() == original_text
+    assert all(backup.read_text() == "older backup" for backup in existing)
+
+
+def test_failed_migration_backup_leaves_no_partial_backup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    metadata_path = tmp_path / "workspaces.json"
+    original_text = json.dumps({"version": 0, "repos": {}}, indent=2)
+    metadata_path.write_text(original_text)
+
+    def failing_fsync(_fd: int) -> None:
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr("git_cuttle.metadata_manager.os.fsync", failing_fsync)
+
+    with pytest.raises(OSError, match="No space left"):
+        MetadataManager(path=metadata_path).read()
+
+    assert list(tmp_path.glob("workspaces.json.bak.*")) == []
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert metadata_path.read_text() == original_text
+
+
 def test_read_rejects_newer_schema_version(tmp_path: Path) -> None:
     metadata_path = tmp_path / "workspaces.json"
     metadata_path.write_text(
@@ -245,6 +245,28 @@ def test_create_octopus_workspace_rejects_duplicate_parent_refs(tmp_path: Path)
     assert exc_info.value.message == "octopus parent refs must be unique"
 
 
+@pytest.mark.integration
+def test_create_octopus_workspace_reports_every_missing_parent_ref(
+    tmp_path: Path,
+) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+
+    metadata_manager = MetadataManager(path=tmp_path / "workspaces.json")
+
+    with pytest.raises(AppError) as exc_info:
+        create_octopus_workspace(
+            cwd=repo,
+            branch="integration/missing",
+            parent_refs=["missing-a", "main", "missing-b"],
+            metadata_manager=metadata_manager,
+        )
+
+    assert exc_info.value.code == "invalid-base-ref"
+    assert exc_info.value.details == "missing-a, missing-b"
+
+
 @pytest.mark.integration
 def test_create_standard_workspace_rolls_back_git_state_when_metadata_write_fails(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
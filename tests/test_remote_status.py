@@ -149,6 +149,51 @@ def test_remote_ahead_behind_counts_diverged_branch(tmp_path: Path) -> None:
     assert status.known
 
 
+def test_remote_ahead_behind_for_repo_ignores_unrelated_configured_upstream(
+    tmp_path: Path,
+) -> None:
+    remote = tmp_path / "remote.git"
+    _git(cwd=tmp_path, args=["init", "--bare", str(remote)])
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+    (repo / "README.md").write_text("hello\n")
+    _git(cwd=repo, args=["add", "README.md"])
+    _git(cwd=repo, args=["commit", "-m", "init"])
+    _git(cwd=repo, args=["remote", "add", "origin", str(remote)])
+    _git(cwd=repo, args=["push", "-u", "origin", "main"])
+    _git(cwd=repo, args=["checkout", "-b", "tracked", "--track", "origin/main"])
+    _git(cwd=repo, args=["push", "origin", "tracked"])
+    _git(cwd=repo, args=["checkout", "-b", "untracked", "main"])
+    _git(cwd=repo, args=["push", "origin", "untracked"])
+    for branch in ("tracked", "untracked"):
+        _git(cwd=repo, args=["checkout", branch])
+        (repo / f"{branch}.txt").write_text(f"{branch}\n")
+        _git(cwd=repo, args=["add", f"{branch}.txt"])
+        _git(cwd=repo, args=["commit", "-m", f"{branch} commit"])
+
+    repo_metadata = RepoMetadata(
+        git_dir=(repo / ".git").resolve(strict=False),
+        repo_root=repo.resolve(strict=False),
+        default_remote="origin",
+        tracked_at="2026-03-02T00:00:00Z",
+        updated_at="2026-03-02T00:00:00Z",
+        workspaces={
+            "tracked": _workspace("tracked", tracked_remote="origin"),
+            "untracked": _workspace("untracked", tracked_remote="origin"),
+        },
+    )
+
+    statuses = remote_ahead_behind_for_repo(repo=repo_metadata)
+
+    # Both are measured against origin/<branch>, whatever git config says.
+    for branch in ("tracked", "untracked"):
+        assert statuses[branch].upstream_ref == f"origin/{branch}"
+        assert statuses[branch].ahead == 1
+        assert statuses[branch].behind == 0
+
+
 def test_remote_status_cache_reuses_value_within_ttl(tmp_path: Path) -> None:
     now_values = iter([100.0, 120.0])
     cache = RemoteStatusCache(now=lambda: next(now_values))
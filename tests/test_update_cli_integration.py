@@ -156,6 +156,70 @@ def test_cli_update_rebases_standard_workspace_onto_upstream(tmp_path: Path) ->
     assert rebased_parent == upstream_head
 
 
+@pytest.mark.integration
+def test_cli_list_after_update_reports_fresh_ahead_behind(tmp_path: Path) -> None:
+    bare_remote, local = _clone_local_remote(tmp_path=tmp_path)
+
+    _git(cwd=local, args=["checkout", "-b", "feature/update"])
+    (local / "feature.txt").write_text("local a\n")
+    _git(cwd=local, args=["add", "feature.txt"])
+    _git(cwd=local, args=["commit", "-m", "local a"])
+    _git(cwd=local, args=["push", "-u", "origin", "feature/update"])
+
+    upstream_writer = tmp_path / "upstream-writer"
+    _git(cwd=tmp_path, args=["clone", str(bare_remote), str(upstream_writer)])
+    _git(cwd=upstream_writer, args=["config", "user.name", "Test User"])
+    _git(cwd=upstream_writer, args=["config", "user.email", "test@example.com"])
+    _git(cwd=upstream_writer, args=["checkout", "feature/update"])
+    (upstream_writer / "upstream.txt").write_text("upstream b\n")
+    _git(cwd=upstream_writer, args=["add", "upstream.txt"])
+    _git(cwd=upstream_writer, args=["commit", "-m", "upstream b"])
+    _git(cwd=upstream_writer, args=["push", "origin", "feature/update"])
+
+    (local / "local.txt").write_text("local c\n")
+    _git(cwd=local, args=["add", "local.txt"])
+    _git(cwd=local, args=["commit", "-m", "local c"])
+    _git(cwd=local, args=["fetch", "origin"])
+
+    xdg_data_home = tmp_path / "xdg"
+    _write_repo_metadata(
+        metadata_path=xdg_data_home / "gitcuttle" / "workspaces.json",
+        repo=local,
+        default_remote="origin",
+        workspace=WorkspaceMetadata(
+            branch="feature/update",
+            worktree_path=local,
+            tracked_remote="origin",
+            kind="standard",
+            base_ref="main",
+            octopus_parents=(),
+            created_at="2026-03-02T00:00:00Z",
+            updated_at="2026-03-02T00:00:00Z",
+        ),
+    )
+    env = dict(os.environ)
+    env["XDG_DATA_HOME"] = str(xdg_data_home)
+
+    def list_counts() -> tuple[object, object]:
+        result = subprocess.run(
+            ["gitcuttle", "list", "--json"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=local,
+            env=env,
+        )
+        row = json.loads(result.stdout)["workspaces"][0]
+        return row["ahead"], row["behind"]
+
+    ahead_before, behind_before = list_counts()
+    assert _run_update(cwd=local, xdg_data_home=xdg_data_home).returncode == 0
+    ahead_after, behind_after = list_counts()
+
+    assert (ahead_before, behind_before) != (ahead_after, behind_after)
+    assert str(behind_after) == "0"
+
+
 @pytest.mark.integration
 def test_cli_update_errors_for_standard_workspace_without_upstream(
     tmp_path: Path,